@@ -12,7 +12,7 @@ __version__ = "3.0.0"
 __author__ = "UnkL4b"
 
 from gitminer.config_manager import ConfigManager
-from gitminer.github_client import GitHubClient
+from gitminer.github_client import AsyncGitHubClient, GitHubClient
 from gitminer.file_manager import FileManager
 from gitminer.pattern_analyzer import PatternAnalyzer
 from gitminer.database import DatabaseManager
@@ -21,6 +21,7 @@ from gitminer.report_generator import ReportGenerator
 __all__ = [
     "ConfigManager",
     "GitHubClient",
+    "AsyncGitHubClient",
     "FileManager",
     "PatternAnalyzer",
     "DatabaseManager",
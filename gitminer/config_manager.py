@@ -6,15 +6,18 @@ from YAML files and environment variables.
 """
 
 import os
+import pickle
 import re
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 import yaml
 
-from gitminer.utils import highlight
+from gitminer.utils import highlight, compile_pattern
 from colorama import Fore
 
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class ConfigManager:
     """
@@ -29,7 +32,8 @@ class ConfigManager:
         config_dir: str = "config",
         paths_file: str = "paths.yaml",
         labels_file: Optional[str] = None,
-        patterns_file: Optional[str] = None
+        patterns_file: Optional[str] = None,
+        verbose: bool = True
     ):
         """
         Initialize the configuration manager.
@@ -39,8 +43,10 @@ class ConfigManager:
             paths_file: Filename for paths configuration
             labels_file: Optional filename for labels configuration
             patterns_file: Optional filename for patterns configuration
+            verbose: Whether to print informational messages while loading
         """
         self.config_dir = Path(config_dir)
+        self.verbose = verbose
         self.paths_config: Dict[str, Any] = {}
         self.labels: Dict[str, str] = {}
         self.patterns: Dict[str, re.Pattern] = {}
@@ -59,6 +65,9 @@ class ConfigManager:
         """
         Load and parse a YAML file.
 
+        Parsed data is cached in a sibling ``.pkl`` file which is reused
+        as long as it is not older than the YAML source.
+
         Args:
             filepath: Path to the YAML file
 
@@ -74,15 +83,61 @@ class ConfigManager:
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {filepath}")
         
+        cache_path = file_path.with_suffix(file_path.suffix + '.pkl')
+        cached = self._read_cache(cache_path, file_path)
+        if cached is not None:
+            return cached
+
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                return data if data else {}
+                data = yaml.load(file, Loader=_Loader)
         except yaml.YAMLError as error:
             raise yaml.YAMLError(
                 f"Error parsing YAML file {filepath}: {error}"
             )
 
+        data = data if data else {}
+        self._write_cache(cache_path, data)
+        return data
+
+    def _read_cache(self, cache_path: Path, source_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load previously parsed YAML data if the cache is still fresh.
+
+        Args:
+            cache_path: Path to the pickle cache file
+            source_path: Path to the YAML file the cache was built from
+
+        Returns:
+            Cached data, or None if the cache is missing, stale or unreadable
+        """
+        try:
+            if cache_path.stat().st_mtime < source_path.stat().st_mtime:
+                return None
+            with open(cache_path, 'rb') as cache_file:
+                data = pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    def _write_cache(self, cache_path: Path, data: Dict[str, Any]) -> None:
+        """
+        Store parsed YAML data next to its source file.
+
+        Failures are ignored so read-only configuration directories
+        keep working without a cache.
+
+        Args:
+            cache_path: Path to the pickle cache file
+            data: Parsed YAML data
+        """
+        try:
+            with open(cache_path, 'wb') as cache_file:
+                pickle.dump(data, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
     def _load_paths_config(self, filename: str) -> None:
         """
         Load paths configuration from YAML file.
@@ -94,10 +149,11 @@ class ConfigManager:
         
         try:
             self.paths_config = self._load_yaml_file(str(filepath))
-            print(highlight(
-                f"[+] Loaded paths configuration from {filepath}",
-                Fore.GREEN
-            ))
+            if self.verbose:
+                print(highlight(
+                    f"[+] Loaded paths configuration from {filepath}",
+                    Fore.GREEN
+                ))
         except Exception as error:
             print(highlight(
                 f"[!] Failed to load paths config: {error}. Using defaults.",
@@ -115,14 +171,18 @@ class ConfigManager:
             },
             'files': {
                 'database': 'gitminer_history.sqlite',
-                'output_csv': 'results.csv'
+                'output_csv': 'results.csv',
+                'etag_cache': 'etag_cache',
+                'search_cache': 'search_cache'
             },
             'github': {
                 'search_url': 'https://api.github.com/search/code',
                 'contents_url': 'https://api.github.com/repos/{repo}/contents/{path}',
                 'rate_limit_url': 'https://api.github.com/rate_limit',
+                'graphql_url': 'https://api.github.com/graphql',
                 'user_agent': 'GitMiner-v3',
                 'timeout': 60,
+                'search_cache_ttl': 900,
                 'per_page_default': 30,
                 'max_results_default': 200
             }
@@ -141,10 +201,11 @@ class ConfigManager:
         try:
             data = self._load_yaml_file(filepath)
             self.labels = {str(key): str(value) for key, value in data.items()}
-            print(highlight(
-                f"[+] Loaded {len(self.labels)} label patterns",
-                Fore.GREEN
-            ))
+            if self.verbose:
+                print(highlight(
+                    f"[+] Loaded {len(self.labels)} label patterns",
+                    Fore.GREEN
+                ))
         except Exception as error:
             print(highlight(
                 f"[!] Failed to load labels: {error}. Using defaults.",
@@ -178,13 +239,14 @@ class ConfigManager:
         try:
             data = self._load_yaml_file(filepath)
             self.patterns = {
-                str(key): re.compile(str(value))
+                str(key): compile_pattern(str(value))
                 for key, value in data.items()
             }
-            print(highlight(
-                f"[+] Loaded {len(self.patterns)} detection patterns",
-                Fore.GREEN
-            ))
+            if self.verbose:
+                print(highlight(
+                    f"[+] Loaded {len(self.patterns)} detection patterns",
+                    Fore.GREEN
+                ))
         except Exception as error:
             print(highlight(
                 f"[!] Failed to load patterns: {error}. Using defaults.",
@@ -205,7 +267,7 @@ class ConfigManager:
             "HIGH_ENTROPY": r"\b[A-Za-z0-9\-_]{30,}\b",
         }
         self.patterns = {
-            key: re.compile(pattern)
+            key: compile_pattern(pattern)
             for key, pattern in default_patterns.items()
         }
 
@@ -246,6 +308,19 @@ class ConfigManager:
         """
         return os.environ.get('GITHUB_TOKEN')
 
+    def get_github_tokens(self) -> List[str]:
+        """
+        Get all GitHub tokens from the environment.
+
+        GITHUB_TOKEN may hold several comma-separated tokens, which the
+        client rotates through to spread requests across rate limits.
+
+        Returns:
+            List of GitHub tokens, empty if none are set
+        """
+        value = os.environ.get('GITHUB_TOKEN') or ''
+        return [token.strip() for token in value.split(',') if token.strip()]
+
     def get_labels(self) -> Dict[str, str]:
         """
         Get all label mappings.
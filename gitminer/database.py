@@ -5,15 +5,44 @@ This module handles SQLite database operations for tracking
 search history and downloaded files.
 """
 
+import queue
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 
 from colorama import Fore
 
 from gitminer.utils import highlight
 
+_READ_POOL_SIZE = 4
+
+_SQL_INSERT_SEARCH = """
+    INSERT INTO search_history
+    (dork, searched_at, results_count, downloaded_count)
+    VALUES (?, ?, ?, ?)
+    RETURNING id
+"""
+
+_SQL_INSERT_DOWNLOADED_FILE = """
+    INSERT OR IGNORE INTO downloaded_files
+    (dork, repository, file_path, local_path, item_url,
+     searched_at, file_size, content_hash, sha)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+_SQL_INSERT_FINDING = """
+    INSERT INTO findings
+    (file_id, label, matched_text, context, line_number, severity)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# executemany() reports no rowcount for RETURNING statements, so only the
+# single-row insert asks for the id back
+_SQL_INSERT_FINDING_RETURNING = _SQL_INSERT_FINDING + "    RETURNING id\n"
+
 
 class DatabaseManager:
     """
@@ -32,8 +61,49 @@ class DatabaseManager:
         """
         self.database_path = Path(database_path)
         self.connection: Optional[sqlite3.Connection] = None
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._in_batch = False
         self._initialize_database()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open a connection with the per-connection settings applied.
+
+        Returns:
+            Configured SQLite connection
+        """
+        connection = sqlite3.connect(
+            str(self.database_path),
+            check_same_thread=False
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-131072")
+        connection.execute("PRAGMA mmap_size=268435456")
+        return connection
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a reader connection from the pool.
+
+        In WAL mode readers do not block the writer, so queries run on
+        pooled connections while inserts stay on ``self.connection``.
+        In-memory databases cannot be shared and use the writer directly.
+
+        Yields:
+            SQLite connection for read-only queries
+        """
+        if str(self.database_path) == ':memory:':
+            yield self.connection
+            return
+
+        connection = self._read_pool.get()
+        try:
+            yield connection
+        finally:
+            self._read_pool.put(connection)
+
     def _initialize_database(self) -> None:
         """
         Initialize the database and create tables if they don't exist.
@@ -41,14 +111,15 @@ class DatabaseManager:
         try:
             self.database_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.connection = sqlite3.connect(
-                str(self.database_path),
-                check_same_thread=False
-            )
-            self.connection.row_factory = sqlite3.Row
+            self.connection = self._open_connection()
             
             cursor = self.connection.cursor()
             
+            # Only takes effect on a fresh database, before WAL is enabled
+            cursor.execute("PRAGMA page_size=8192")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS search_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -71,10 +142,25 @@ class DatabaseManager:
                     searched_at TEXT,
                     downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     file_size INTEGER,
+                    content_hash INTEGER,
+                    sha TEXT,
                     UNIQUE(repository, file_path, dork)
                 )
             """)
             
+            columns = {
+                row[1] for row in
+                cursor.execute("PRAGMA table_info(downloaded_files)")
+            }
+            if 'content_hash' not in columns:
+                cursor.execute(
+                    "ALTER TABLE downloaded_files ADD COLUMN content_hash INTEGER"
+                )
+            if 'sha' not in columns:
+                cursor.execute(
+                    "ALTER TABLE downloaded_files ADD COLUMN sha TEXT"
+                )
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS findings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -99,13 +185,40 @@ class DatabaseManager:
                 ON downloaded_files(dork)
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_files_hash
+                ON downloaded_files(content_hash)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_files_sha
+                ON downloaded_files(sha)
+            """)
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_findings_severity
                 ON findings(severity)
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_findings_file
+                ON findings(file_id)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_findings_sev_found
+                ON findings(severity, found_at DESC)
+            """)
+            
+            cursor.execute("PRAGMA analysis_limit=400")
+            cursor.execute("ANALYZE")
+            
             self.connection.commit()
             
+            if str(self.database_path) != ':memory:':
+                for _ in range(_READ_POOL_SIZE):
+                    self._read_pool.put(self._open_connection())
+            
             print(highlight(
                 f"[+] Database initialized: {self.database_path}",
                 Fore.GREEN
@@ -118,6 +231,35 @@ class DatabaseManager:
             ))
             raise
 
+    def begin(self) -> None:
+        """
+        Start a batch in which the record methods do not commit.
+
+        Rows written until commit() share a single transaction, so a
+        loop of inserts costs one sync instead of one per row. Rows are
+        not visible to the pooled readers until the batch is committed.
+        """
+        if not self.connection.in_transaction:
+            self.connection.execute("BEGIN")
+        self._in_batch = True
+
+    def commit(self) -> None:
+        """Commit pending writes and end the current batch."""
+        self._in_batch = False
+        try:
+            self.connection.commit()
+            
+        except Exception as error:
+            print(highlight(
+                f"[!] Error committing transaction: {error}",
+                Fore.RED
+            ))
+
+    def _commit_row(self) -> None:
+        """Commit a single record unless a batch is open."""
+        if not self._in_batch:
+            self.connection.commit()
+
     def record_search(
         self,
         dork: str,
@@ -138,15 +280,14 @@ class DatabaseManager:
             ID of the inserted record, or None if insert failed
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO search_history
+            cursor = self.connection.execute(
+                _SQL_INSERT_SEARCH,
                 (dork, searched_at, results_count, downloaded_count)
-                VALUES (?, ?, ?, ?)
-            """, (dork, searched_at, results_count, downloaded_count))
+            )
+            row = cursor.fetchone()
             
-            self.connection.commit()
-            return cursor.lastrowid
+            self._commit_row()
+            return row[0] if row else None
             
         except Exception as error:
             print(highlight(
@@ -163,7 +304,9 @@ class DatabaseManager:
         local_path: Optional[str] = None,
         item_url: Optional[str] = None,
         searched_at: Optional[str] = None,
-        file_size: Optional[int] = None
+        file_size: Optional[int] = None,
+        content_hash: Optional[int] = None,
+        sha: Optional[str] = None
     ) -> Optional[int]:
         """
         Record a downloaded file in the database.
@@ -176,24 +319,22 @@ class DatabaseManager:
             item_url: URL to the file on GitHub
             searched_at: ISO timestamp of the search
             file_size: Size of the file in bytes
+            content_hash: 64-bit hash of the file content for deduplication
+            sha: Git blob SHA reported by the search API
 
         Returns:
-            ID of the inserted record, or None if insert failed
+            ID of the inserted record, or None if the file was already
+            recorded or the insert failed
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT OR IGNORE INTO downloaded_files
-                (dork, repository, file_path, local_path, item_url,
-                 searched_at, file_size)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor = self.connection.execute(_SQL_INSERT_DOWNLOADED_FILE, (
                 dork, repository, file_path, local_path,
-                item_url, searched_at, file_size
+                item_url, searched_at, file_size, content_hash, sha
             ))
+            row = cursor.fetchone()
             
-            self.connection.commit()
-            return cursor.lastrowid
+            self._commit_row()
+            return row[0] if row else None
             
         except Exception as error:
             print(highlight(
@@ -226,15 +367,14 @@ class DatabaseManager:
             ID of the inserted record, or None if insert failed
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO findings
+            cursor = self.connection.execute(
+                _SQL_INSERT_FINDING_RETURNING,
                 (file_id, label, matched_text, context, line_number, severity)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (file_id, label, matched_text, context, line_number, severity))
+            )
+            row = cursor.fetchone()
             
-            self.connection.commit()
-            return cursor.lastrowid
+            self._commit_row()
+            return row[0] if row else None
             
         except Exception as error:
             print(highlight(
@@ -243,29 +383,107 @@ class DatabaseManager:
             ))
             return None
 
+    def record_findings_batch(
+        self,
+        rows: Iterable[Tuple[int, str, str, str, Optional[int], str]]
+    ) -> int:
+        """
+        Record many pattern findings in a single transaction.
+
+        Args:
+            rows: Iterable of tuples with the same fields as record_finding:
+                (file_id, label, matched_text, context, line_number, severity)
+
+        Returns:
+            Number of inserted records, or 0 if the insert failed
+        """
+        try:
+            cursor = self.connection.executemany(_SQL_INSERT_FINDING, rows)
+            
+            self._commit_row()
+            return cursor.rowcount
+            
+        except Exception as error:
+            if not self._in_batch:
+                self.connection.rollback()
+            print(highlight(
+                f"[!] Error recording findings batch: {error}",
+                Fore.RED
+            ))
+            return 0
+
+    def get_content_hashes(self) -> Iterator[Tuple[int, str]]:
+        """
+        Retrieve content hashes of previously downloaded files.
+
+        Yields:
+            Tuples of (content_hash, local_path)
+        """
+        try:
+            with self._read_connection() as connection:
+                for row in connection.execute("""
+                    SELECT content_hash, local_path FROM downloaded_files
+                    WHERE content_hash IS NOT NULL AND local_path IS NOT NULL
+                """):
+                    yield row[0], row[1]
+            
+        except Exception as error:
+            print(highlight(
+                f"[!] Error retrieving content hashes: {error}",
+                Fore.RED
+            ))
+
+    def get_local_path_by_sha(self, sha: str) -> Optional[str]:
+        """
+        Find where a blob was saved by a previous download.
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            Local path of the saved file, or None if the blob is unknown
+        """
+        try:
+            with self._read_connection() as connection:
+                row = connection.execute("""
+                    SELECT local_path FROM downloaded_files
+                    WHERE sha = ? AND local_path IS NOT NULL
+                    ORDER BY id DESC
+                    LIMIT 1
+                """, (sha,)).fetchone()
+            return row[0] if row else None
+            
+        except Exception as error:
+            print(highlight(
+                f"[!] Error looking up blob {sha}: {error}",
+                Fore.RED
+            ))
+            return None
+
     def get_search_history(
         self,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """
         Retrieve search history from the database.
 
+        Rows are fetched before the pooled reader connection is returned,
+        so callers never hold a connection while they iterate.
+
         Args:
             limit: Maximum number of records to return
 
         Returns:
-            List of search history records as dictionaries
+            List of search history rows (use ``dict(row)`` for a plain
+            dictionary)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT * FROM search_history
-                ORDER BY created_at DESC
-                LIMIT ?
-            """, (limit,))
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._read_connection() as connection:
+                return connection.execute("""
+                    SELECT * FROM search_history
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, (limit,)).fetchall()
             
         except Exception as error:
             print(highlight(
@@ -278,36 +496,38 @@ class DatabaseManager:
         self,
         dork: Optional[str] = None,
         limit: int = 1000
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """
         Retrieve downloaded files from the database.
 
+        Rows are fetched before the pooled reader connection is returned,
+        so callers never hold a connection while they iterate.
+
         Args:
             dork: Optional dork filter
             limit: Maximum number of records to return
 
         Returns:
-            List of downloaded file records as dictionaries
+            List of downloaded file rows (use ``dict(row)`` for a plain
+            dictionary)
         """
         try:
-            cursor = self.connection.cursor()
-            
-            if dork:
-                cursor.execute("""
-                    SELECT * FROM downloaded_files
-                    WHERE dork = ?
-                    ORDER BY downloaded_at DESC
-                    LIMIT ?
-                """, (dork, limit))
-            else:
-                cursor.execute("""
-                    SELECT * FROM downloaded_files
-                    ORDER BY downloaded_at DESC
-                    LIMIT ?
-                """, (limit,))
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._read_connection() as connection:
+                if dork:
+                    cursor = connection.execute("""
+                        SELECT * FROM downloaded_files
+                        WHERE dork = ?
+                        ORDER BY downloaded_at DESC
+                        LIMIT ?
+                    """, (dork, limit))
+                else:
+                    cursor = connection.execute("""
+                        SELECT * FROM downloaded_files
+                        ORDER BY downloaded_at DESC
+                        LIMIT ?
+                    """, (limit,))
+                
+                return cursor.fetchall()
             
         except Exception as error:
             print(highlight(
@@ -320,30 +540,31 @@ class DatabaseManager:
         self,
         severity: str,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """
         Retrieve findings filtered by severity level.
 
+        Rows are fetched before the pooled reader connection is returned,
+        so callers never hold a connection while they iterate.
+
         Args:
             severity: Severity level (HIGH, MEDIUM, LOW)
             limit: Maximum number of records to return
 
         Returns:
-            List of finding records as dictionaries
+            List of finding rows (use ``dict(row)`` for a plain
+            dictionary)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT f.*, df.repository, df.file_path, df.local_path
-                FROM findings f
-                JOIN downloaded_files df ON f.file_id = df.id
-                WHERE f.severity = ?
-                ORDER BY f.found_at DESC
-                LIMIT ?
-            """, (severity, limit))
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._read_connection() as connection:
+                return connection.execute("""
+                    SELECT f.*, df.repository, df.file_path, df.local_path
+                    FROM findings f
+                    JOIN downloaded_files df ON f.file_id = df.id
+                    WHERE f.severity = ?
+                    ORDER BY f.found_at DESC
+                    LIMIT ?
+                """, (severity, limit)).fetchall()
             
         except Exception as error:
             print(highlight(
@@ -360,30 +581,31 @@ class DatabaseManager:
             Dictionary containing various statistics
         """
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM search_history")
-            total_searches = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM downloaded_files")
-            total_files = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM findings")
-            total_findings = cursor.fetchone()[0]
-            
-            cursor.execute("""
-                SELECT severity, COUNT(*) as count
-                FROM findings
-                GROUP BY severity
-            """)
-            severity_counts = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            return {
-                "total_searches": total_searches,
-                "total_downloaded_files": total_files,
-                "total_findings": total_findings,
-                "severity_distribution": severity_counts
-            }
+            with self._read_connection() as connection:
+                cursor = connection.cursor()
+                
+                cursor.execute("SELECT COUNT(*) FROM search_history")
+                total_searches = cursor.fetchone()[0]
+                
+                cursor.execute("SELECT COUNT(*) FROM downloaded_files")
+                total_files = cursor.fetchone()[0]
+                
+                cursor.execute("SELECT COUNT(*) FROM findings")
+                total_findings = cursor.fetchone()[0]
+                
+                cursor.execute("""
+                    SELECT severity, COUNT(*) as count
+                    FROM findings
+                    GROUP BY severity
+                """)
+                severity_counts = {row[0]: row[1] for row in cursor.fetchall()}
+                
+                return {
+                    "total_searches": total_searches,
+                    "total_downloaded_files": total_files,
+                    "total_findings": total_findings,
+                    "severity_distribution": severity_counts
+                }
             
         except Exception as error:
             print(highlight(
@@ -394,6 +616,9 @@ class DatabaseManager:
 
     def close(self) -> None:
         """Close the database connection."""
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+
         if self.connection:
             self.connection.close()
             print(highlight(
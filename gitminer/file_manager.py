@@ -5,14 +5,122 @@ This module handles file operations including downloading, saving,
 and organizing files retrieved from GitHub repositories.
 """
 
+import codecs
+import hashlib
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union
 
 from colorama import Fore
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from gitminer.utils import highlight, sanitize_filename
 
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+_MMAP_THRESHOLD = 1 << 20
+
+_TARGET_DIR_CACHE_SIZE = 4096
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _detect_bom(raw: Union[bytes, mmap.mmap]) -> Optional[str]:
+    """
+    Detect a Unicode byte order mark at the start of raw content.
+
+    Args:
+        raw: Raw file content
+
+    Returns:
+        Codec name matching the BOM, or None if there is no BOM
+    """
+    head = raw[:4]
+    for bom, codec in _BOMS:
+        if head.startswith(bom):
+            return codec
+    return None
+
+
+def _new_hasher() -> Any:
+    """
+    Create an incremental 64-bit content hasher.
+
+    Uses SIMD-accelerated xxh3 when ``xxhash`` is installed, otherwise
+    an 8-byte BLAKE2b digest.
+
+    Returns:
+        Hash object with ``update`` and ``digest`` methods
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+
+def _digest_to_int(hasher: Any) -> int:
+    """
+    Convert a 64-bit digest to a signed integer that fits SQLite INTEGER.
+
+    Args:
+        hasher: Hash object created by _new_hasher
+
+    Returns:
+        Signed 64-bit content hash
+    """
+    return int.from_bytes(hasher.digest(), 'big', signed=True)
+
+
+def _walk_files(dirpath: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield regular file entries below a directory.
+
+    Uses ``os.scandir`` so file type and stat results come from the
+    cached directory entry instead of separate syscalls per path.
+
+    Args:
+        dirpath: Directory to walk
+
+    Yields:
+        Directory entries of regular files
+    """
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except PermissionError:
+        return
+
+
+def _sum_file_sizes(dirpath: str) -> int:
+    """
+    Sum the sizes of all regular files below a directory.
+
+    Args:
+        dirpath: Directory to walk
+
+    Returns:
+        Total size in bytes
+    """
+    return sum(
+        entry.stat(follow_symlinks=False).st_size
+        for entry in _walk_files(dirpath)
+    )
+
 
 class FileManager:
     """
@@ -31,13 +139,18 @@ class FileManager:
         """
         self.base_directory = Path(base_directory)
         self.base_directory.mkdir(parents=True, exist_ok=True)
+        self._collision_counters: Dict[str, int] = {}
+        self._target_dirs: Dict[Tuple[str, str], str] = {}
+        self._content_hashes: Dict[int, str] = {}
+        self._path_hashes: Dict[str, int] = {}
 
     def save_file(self, content: bytes, repository: str, file_path: str, dork_keyword: str) -> Optional[str]:
         """
         Save file content to disk with organized directory structure.
 
         Creates a directory structure based on the dork keyword and
-        repository name to keep files organized.
+        repository name to keep files organized. Content that was already
+        saved is not written again; the existing path is returned instead.
 
         Args:
             content: Raw file content as bytes
@@ -48,14 +161,53 @@ class FileManager:
         Returns:
             Local file path where content was saved, or None if save failed
         """
-        try:
-            safe_keyword = sanitize_filename(dork_keyword)
-            safe_repo = sanitize_filename(repository.replace('/', '_'))
+        hasher = _new_hasher()
+        hasher.update(content)
+        existing_path = self._find_duplicate(_digest_to_int(hasher))
+        if existing_path:
+            return existing_path
+
+        return self.save_stream(
+            chunks=(content,),
+            repository=repository,
+            file_path=file_path,
+            dork_keyword=dork_keyword,
+            size=len(content)
+        )
+
+    def save_stream(
+        self,
+        chunks: Iterable[bytes],
+        repository: str,
+        file_path: str,
+        dork_keyword: str,
+        size: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Save streamed file content to disk without buffering it in memory.
+
+        Uses the same directory layout as save_file. When the final size
+        is known the file is preallocated so the filesystem can place it
+        contiguously. If the content turns out to duplicate a file that
+        was already saved, the new copy is removed and the existing path
+        is returned.
 
-            target_dir = self.base_directory / safe_keyword / safe_repo
-            target_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            chunks: Iterable of content chunks (e.g. ``response.iter_content``)
+            repository: Full repository name (owner/repo)
+            file_path: Original file path in the repository
+            dork_keyword: Keyword extracted from the dork query
+            size: Expected size in bytes, if known
 
-            filename = Path(file_path).name
+        Returns:
+            Local file path where content was saved, or None if save failed
+        """
+        target_path = None
+
+        try:
+            target_dir = self._get_target_dir(dork_keyword, repository)
+
+            filename = os.path.basename(file_path)
             safe_filename = sanitize_filename(filename)
 
             if not safe_filename or safe_filename == '_':
@@ -63,30 +215,161 @@ class FileManager:
                     file_path.replace('/', '_')
                 )
 
-            target_path = target_dir / safe_filename
-
-            if target_path.exists():
-                counter = 1
-                stem = target_path.stem
-                suffix = target_path.suffix
-
-                while target_path.exists():
-                    new_name = f"{stem}_{counter}{suffix}"
-                    target_path = target_dir / new_name
-                    counter += 1
+            fd, target_path = self._create_unique_file(
+                target_dir,
+                safe_filename
+            )
 
-            with open(target_path, 'wb') as file:
-                file.write(content)
+            try:
+                if size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, size)
+                    except OSError:
+                        pass
 
-            return str(target_path)
+                hasher = _new_hasher()
+                written = 0
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    view = memoryview(chunk)
+                    while view:
+                        count = os.write(fd, view)
+                        view = view[count:]
+                        written += count
+
+                if size and written < size:
+                    os.ftruncate(fd, written)
+            finally:
+                os.close(fd)
+
+            content_hash = _digest_to_int(hasher)
+            existing_path = self._find_duplicate(content_hash)
+            if existing_path:
+                os.unlink(target_path)
+                return existing_path
+
+            self.register_content_hash(content_hash, target_path)
+            return target_path
 
         except Exception as error:
+            if target_path is not None:
+                try:
+                    os.unlink(target_path)
+                except OSError:
+                    pass
             print(highlight(
                 f"[!] Error saving file {file_path}: {error}",
                 Fore.RED
             ))
             return None
 
+    def _find_duplicate(self, content_hash: int) -> Optional[str]:
+        """
+        Look up a previously saved file with the same content.
+
+        Args:
+            content_hash: Hash of the content about to be saved
+
+        Returns:
+            Path of the existing file, or None if there is none on disk
+        """
+        existing_path = self._content_hashes.get(content_hash)
+        if existing_path and os.path.exists(existing_path):
+            return existing_path
+        return None
+
+    def register_content_hash(self, content_hash: int, local_path: str) -> None:
+        """
+        Remember the content hash of a saved file for deduplication.
+
+        Args:
+            content_hash: Hash of the file content
+            local_path: Local path of the saved file
+        """
+        self._content_hashes[content_hash] = local_path
+        self._path_hashes[local_path] = content_hash
+
+    def get_content_hash(self, local_path: str) -> Optional[int]:
+        """
+        Get the content hash of a file saved by this manager.
+
+        Args:
+            local_path: Local path returned by save_file or save_stream
+
+        Returns:
+            Content hash, or None if the file is unknown
+        """
+        return self._path_hashes.get(local_path)
+
+    def _get_target_dir(self, dork_keyword: str, repository: str) -> str:
+        """
+        Get (and create once) the directory for a keyword/repository pair.
+
+        Created directories are remembered, up to a bounded number of
+        pairs, so later saves skip the sanitize and mkdir work.
+
+        Args:
+            dork_keyword: Keyword extracted from the dork query
+            repository: Full repository name (owner/repo)
+
+        Returns:
+            Directory where files for this pair are stored
+        """
+        key = (dork_keyword, repository)
+        target_dir = self._target_dirs.get(key)
+
+        if target_dir is None:
+            safe_keyword = sanitize_filename(dork_keyword)
+            safe_repo = sanitize_filename(repository.replace('/', '_'))
+
+            target_dir = os.path.join(
+                self.base_directory, safe_keyword, safe_repo
+            )
+            os.makedirs(target_dir, exist_ok=True)
+
+            if len(self._target_dirs) >= _TARGET_DIR_CACHE_SIZE:
+                self._target_dirs.pop(next(iter(self._target_dirs)))
+            self._target_dirs[key] = target_dir
+
+        return target_dir
+
+    def _create_unique_file(self, target_dir: str, filename: str) -> Tuple[int, str]:
+        """
+        Atomically create a new file, adding a numeric suffix on collision.
+
+        Each attempt is a single ``O_EXCL`` open, and the last suffix used
+        for a name is remembered so repeated collisions do not probe the
+        same candidates again.
+
+        Args:
+            target_dir: Directory in which to create the file
+            filename: Preferred file name
+
+        Returns:
+            Tuple of (open file descriptor, path of the created file)
+        """
+        target_path = os.path.join(target_dir, filename)
+        counter = self._collision_counters.get(target_path, 0)
+        stem, suffix = os.path.splitext(filename)
+
+        while True:
+            candidate = (
+                target_path if counter == 0
+                else os.path.join(target_dir, f"{stem}_{counter}{suffix}")
+            )
+
+            try:
+                fd = os.open(candidate, _CREATE_FLAGS, 0o644)
+            except FileExistsError:
+                counter += 1
+                continue
+            except FileNotFoundError:
+                os.makedirs(target_dir, exist_ok=True)
+                continue
+
+            self._collision_counters[target_path] = counter + 1
+            return fd, candidate
+
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
         Get information about a saved file.
@@ -123,6 +406,9 @@ class FileManager:
         """
         Read file content as text with encoding fallback.
 
+        A leading byte order mark takes precedence over the requested
+        encodings, so UTF-16/32 files are not misread as Latin-1.
+
         Args:
             file_path: Path to the file to read
             encoding: Primary encoding to try (default: utf-8)
@@ -133,12 +419,13 @@ class FileManager:
         """
         try:
             with open(file_path, 'rb') as file:
-                raw_content = file.read()
+                if os.fstat(file.fileno()).st_size < _MMAP_THRESHOLD:
+                    return self._decode(file.read(), encoding, fallback_encoding)
 
-            try:
-                return raw_content.decode(encoding)
-            except UnicodeDecodeError:
-                return raw_content.decode(fallback_encoding, errors='ignore')
+                with mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    return self._decode(mapped, encoding, fallback_encoding)
 
         except Exception as error:
             print(highlight(
@@ -147,6 +434,55 @@ class FileManager:
             ))
             return None
 
+    def _decode(self, raw: Union[bytes, mmap.mmap], encoding: str, fallback_encoding: str) -> str:
+        """
+        Decode raw content, honouring a BOM before trying the given encodings.
+
+        Args:
+            raw: Raw content as bytes or a memory map
+            encoding: Primary encoding to try
+            fallback_encoding: Fallback encoding if primary fails
+
+        Returns:
+            Decoded text
+        """
+        bom_encoding = _detect_bom(raw)
+        if bom_encoding:
+            return str(raw, bom_encoding, 'replace')
+
+        try:
+            return str(raw, encoding)
+        except UnicodeDecodeError:
+            return str(raw, fallback_encoding, 'ignore')
+
+    def map_file(self, file_path: str) -> Optional[mmap.mmap]:
+        """
+        Map a file read-only into memory for zero-copy scanning.
+
+        The mapping supports the buffer protocol, so byte-mode regexes
+        can run over it directly. The caller is responsible for closing
+        it (it can be used as a context manager).
+
+        Args:
+            file_path: Path to the file to map
+
+        Returns:
+            Read-only memory map, or None if the file is empty or
+            cannot be mapped
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except Exception as error:
+            print(highlight(
+                f"[!] Error mapping file {file_path}: {error}",
+                Fore.RED
+            ))
+            return None
+
     def list_saved_files(self, dork_keyword: Optional[str] = None) -> list:
         """
         List all saved files, optionally filtered by dork keyword.
@@ -166,10 +502,8 @@ class FileManager:
             else:
                 search_dir = self.base_directory
 
-            if search_dir.exists():
-                for file_path in search_dir.rglob('*'):
-                    if file_path.is_file():
-                        files.append(str(file_path))
+            if search_dir.is_dir():
+                files.extend(entry.path for entry in _walk_files(str(search_dir)))
 
         except Exception as error:
             print(highlight(
@@ -179,12 +513,14 @@ class FileManager:
 
         return files
 
-    def get_directory_size(self, directory: Optional[str] = None) -> int:
+    def get_directory_size(self, directory: Optional[str] = None, parallel: bool = False) -> int:
         """
         Calculate total size of files in a directory.
 
         Args:
             directory: Directory path (uses base_directory if None)
+            parallel: Walk top-level subdirectories concurrently, which
+                overlaps stat latency on network or spinning storage
 
         Returns:
             Total size in bytes
@@ -193,9 +529,24 @@ class FileManager:
         total_size = 0
 
         try:
-            for file_path in target_dir.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
+            if not target_dir.is_dir():
+                return total_size
+
+            if not parallel:
+                return _sum_file_sizes(str(target_dir))
+
+            subdirs = []
+            with os.scandir(target_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+
+            if subdirs:
+                workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    total_size += sum(executor.map(_sum_file_sizes, subdirs))
         except Exception as error:
             print(highlight(
                 f"[!] Error calculating directory size: {error}",
@@ -208,22 +559,41 @@ class FileManager:
         """
         Remove empty directories from the base directory tree.
 
+        The tree is walked bottom-up and each subdirectory is removed
+        from its parent, so directories that only contained empty
+        directories are removed as well. Where available, ``os.fwalk``
+        is used so removals are resolved relative to the parent's file
+        descriptor instead of re-walking the full path.
+
         Returns:
             Number of directories removed
         """
         removed_count = 0
+        self._target_dirs.clear()
 
         try:
-            for dirpath, dirnames, filenames in os.walk(
-                self.base_directory,
-                topdown=False
-            ):
-                if not dirnames and not filenames:
-                    try:
-                        os.rmdir(dirpath)
-                        removed_count += 1
-                    except OSError:
-                        pass
+            if hasattr(os, 'fwalk'):
+                for _, dirnames, _, dirfd in os.fwalk(
+                    self.base_directory,
+                    topdown=False
+                ):
+                    for dirname in dirnames:
+                        try:
+                            os.rmdir(dirname, dir_fd=dirfd)
+                            removed_count += 1
+                        except OSError:
+                            pass
+            else:
+                for dirpath, dirnames, _ in os.walk(
+                    self.base_directory,
+                    topdown=False
+                ):
+                    for dirname in dirnames:
+                        try:
+                            os.rmdir(os.path.join(dirpath, dirname))
+                            removed_count += 1
+                        except OSError:
+                            pass
 
         except Exception as error:
             print(highlight(
@@ -5,16 +5,183 @@ Implements real-time progress updates, rate-limit awareness,
 and dynamic wait countdowns inside tqdm progress bar.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import atexit
+import logging
+import queue
+import shelve
+import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from urllib.parse import urlencode
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 from colorama import Fore, Style
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from gitminer.utils import highlight
 
+logger = logging.getLogger("gitminer")
+
+# Messages are queued and written by a listener thread, so request loops
+# and download workers never block on stdout
+_LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+class _HighlightFormatter(logging.Formatter):
+    """Colors queued messages in the listener thread."""
+
+    _LEVEL_COLORS = {logging.ERROR: Fore.RED, logging.WARNING: Fore.YELLOW}
+
+    def format(self, record: logging.LogRecord) -> str:
+        color = getattr(record, "color", None) or self._LEVEL_COLORS.get(record.levelno, Fore.GREEN)
+        return highlight(record.getMessage(), color)
+
+
+def _start_log_listener() -> None:
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_HighlightFormatter())
+        _log_listener = QueueListener(_LOG_QUEUE, handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        logger.addHandler(QueueHandler(_LOG_QUEUE))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def _flush_log() -> None:
+    # Lets queued messages reach stdout before the caller prints its own
+    if _log_listener is not None:
+        _LOG_QUEUE.join()
+
+
+# Response bodies are decoded straight from bytes; orjson is a faster
+# drop-in when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+_json_dumps = orjson.dumps if orjson is not None else (lambda value: json.dumps(value).encode())
+
+# Bodies larger than this are not kept in the ETag cache; once the kept
+# entries exceed _ETAG_CACHE_MAX_BYTES the oldest are evicted
+_ETAG_CACHE_MAX_BODY = 1 << 20
+_ETAG_CACHE_MAX_BYTES = 32 << 20
+
+_RATE_LIMIT_TEMPLATE = (
+    f"Rate limit: {Style.BRIGHT}{Fore.BLUE}{{remaining}}{Style.RESET_ALL}/"
+    f"{Style.BRIGHT}{Fore.GREEN}{{limit}}{Style.RESET_ALL} | "
+    f"Reset in: {{mins}}m {{secs}}s ({{iso}} UTC)"
+)
+
+_WAIT_TEMPLATE = (
+    f"Waiting for rate limit reset ({Style.BRIGHT}{Fore.YELLOW}{{remaining}}{Style.RESET_ALL}s left)"
+)
+
+# Keep-alive connections per host; workers beyond this wait for a free
+# connection instead of opening sockets that get discarded afterwards
+_POOL_MAXSIZE = 32
+
+# Run-scoped cache of blob bytes keyed by git sha, trimmed to a total
+# size; large blobs are not kept
+_BLOB_CACHE_MAX_BYTES = 48 << 20
+_BLOB_CACHE_MAX_BODY = 1 << 20
+
+# Read and write size for streamed downloads
+_STREAM_CHUNK_SIZE = 1 << 17
+
+# Client-wide request pacing: sustained requests per second and burst
+# size, kept below GitHub's secondary rate limits
+_REQUEST_RATE = 30.0
+_REQUEST_BURST = 30
+# Below this share of the core quota the pace follows the requests left
+# until reset, but never drops under _MIN_REQUEST_RATE
+_LOW_QUOTA_FRACTION = 0.1
+_MIN_REQUEST_RATE = 0.1
+
+# Seconds a quota snapshot taken from response headers stays trusted
+_RATE_LIMIT_SNAPSHOT_TTL = 60
+
+
+@functools.lru_cache(maxsize=8)
+def _format_reset_time(reset_ts: int) -> str:
+    # The reset timestamp only changes once per rate-limit window
+    return datetime.fromtimestamp(reset_ts, timezone.utc).strftime("%H:%M:%S")
+
+
+class RateLimiter:
+    """
+    Shared gate and token bucket that paces every request of a client.
+
+    The bucket allows bursts of ``capacity`` requests and refills at
+    ``rate`` requests per second. The gate is closed for the Retry-After
+    interval of a secondary rate limit, or until the reset time when no
+    token has core quota left, so concurrent workers wait once instead
+    of each collecting a 403.
+    """
+
+    def __init__(self, rate: float = _REQUEST_RATE, capacity: float = _REQUEST_BURST):
+        self._lock = threading.Lock()
+        self._open_at = 0.0
+        self._max_rate = rate
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                wait = self._open_at - time.time()
+                if wait <= 0:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def close_until(self, timestamp: float) -> float:
+        with self._lock:
+            self._open_at = max(self._open_at, timestamp)
+            return self._open_at - time.time()
+
+    def pace(self, remaining: int, limit: int, reset: int) -> None:
+        # At full speed the quota runs out well before it resets once it
+        # is this low, so spread what is left over the rest of the window
+        seconds_left = max(1, reset - time.time())
+        if remaining < limit * _LOW_QUOTA_FRACTION:
+            rate = max(_MIN_REQUEST_RATE, remaining / seconds_left)
+        else:
+            rate = self._max_rate
+        with self._lock:
+            self._refill()
+            self._rate = min(self._max_rate, rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
 
 class GitHubClient:
     """
@@ -24,108 +191,449 @@ class GitHubClient:
     and content retrieval with automatic retry logic.
     """
 
-    def __init__(self, token: str, search_url: str, contents_url: str, rate_limit_url: str, user_agent: str = "GitMiner-v3", timeout: int = 60):
-        self.token = token
+    def __init__(self, token: Union[str, List[str]], search_url: str, contents_url: str, rate_limit_url: str, user_agent: str = "GitMiner-v3", timeout: int = 60, etag_cache_path: Optional[str] = None, search_cache_path: Optional[str] = None, search_cache_ttl: int = 900, graphql_url: str = "https://api.github.com/graphql"):
+        _start_log_listener()
+
+        self.tokens = [token] if isinstance(token, str) else list(token)
+        self.token = self.tokens[0]
         self.search_url = search_url
         self.contents_url = contents_url
         self.rate_limit_url = rate_limit_url
+        self.graphql_url = graphql_url
+        # Cleared when the server has no GraphQL endpoint (404), so later
+        # batches go straight to REST downloads
+        self._graphql_available = True
         self.user_agent = user_agent
         self.timeout = timeout
 
         self.headers = {
-            "Authorization": f"Bearer {token}",
+            "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json",
             "User-Agent": user_agent
         }
 
-    def get_rate_limits(self) -> Optional[Dict[str, Any]]:
+        # Makes the contents endpoint return the file bytes directly,
+        # saving the second request to download_url
+        self._raw_headers = {"Accept": "application/vnd.github.raw"}
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_POOL_MAXSIZE,
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Serializes quota checks so concurrent downloads wait on one probe
+        self._rate_limit_lock = threading.Lock()
+        self._limiter = RateLimiter()
+
+        # Requests rotate through the token pool; tokens that hit a 403
+        # are skipped until their reset timestamp
+        self._token_ring = deque(self.tokens)
+        self._token_lock = threading.Lock()
+        self._auth_headers = {
+            token: {"Authorization": f"Bearer {token}"} for token in self.tokens
+        }
+        self._exhausted: Dict[str, int] = {}
+
+        # Search quota per token as (remaining, reset, checked_at), taken
+        # from response headers so most checks need no /rate_limit probe
+        self._rl_snapshots: Dict[str, Tuple[int, int, float]] = {}
+
+        # Conditional requests answered with 304 do not count against the
+        # primary rate limit; the cache maps request keys to
+        # (etag, body, stored_at). Entry sizes are tracked oldest first so
+        # the cache can be trimmed to _ETAG_CACHE_MAX_BYTES
+        self._etag_lock = threading.Lock()
+        if etag_cache_path:
+            Path(etag_cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._etag_cache: Any = shelve.open(etag_cache_path)
+        else:
+            self._etag_cache = {}
+        self._etag_sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._etag_bytes = 0
+        entries = sorted(
+            self._etag_cache.items(),
+            key=lambda item: item[1][2] if len(item[1]) > 2 else 0
+        )
+        for key, entry in entries:
+            self._etag_sizes[key] = len(key) + len(entry[0]) + len(entry[1])
+            self._etag_bytes += self._etag_sizes[key]
+        with self._etag_lock:
+            self._trim_etag_cache()
+
+        # Blobs are content-addressed, so forks and repeated hits of the
+        # same file are served from memory instead of downloaded again
+        self._blob_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._blob_bytes = 0
+        self._blob_lock = threading.Lock()
+
+        # Search results keyed per token so different users never share
+        # entries; each entry is (stored_at, results) and holds copies of
+        # the search fields only, never fetched file contents. Expired
+        # entries are dropped on open and whenever an entry is written
+        self.search_cache_ttl = search_cache_ttl
+        self._search_namespace = hashlib.sha256(
+            "\n".join(sorted(self.tokens)).encode()
+        ).hexdigest()[:16]
+        self._search_lock = threading.Lock()
+        if search_cache_path:
+            Path(search_cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._search_cache: Any = shelve.open(search_cache_path)
+        else:
+            self._search_cache = {}
+        with self._search_lock:
+            self._prune_search_cache()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        _flush_log()
+        self.session.close()
+        with self._etag_lock:
+            if isinstance(self._etag_cache, shelve.Shelf):
+                self._etag_cache.close()
+            self._etag_cache = {}
+            self._etag_sizes.clear()
+            self._etag_bytes = 0
+        with self._search_lock:
+            if isinstance(self._search_cache, shelve.Shelf):
+                self._search_cache.close()
+            self._search_cache = {}
+
+    def _prune_search_cache(self) -> None:
+        # Called with _search_lock held
+        expired_before = time.time() - self.search_cache_ttl
+        for key in list(self._search_cache.keys()):
+            if self._search_cache[key][0] <= expired_before:
+                del self._search_cache[key]
+
+    def _next_headers(self) -> Dict[str, str]:
+        if len(self.tokens) == 1:
+            return {}
+        now = int(time.time())
+        with self._token_lock:
+            for _ in range(len(self._token_ring)):
+                token = self._token_ring[0]
+                self._token_ring.rotate(-1)
+                if self._exhausted.get(token, 0) <= now:
+                    return self._auth_headers[token]
+        return {}
+
+    def _use_token(self, token: str) -> None:
+        with self._token_lock:
+            if token not in self._token_ring:
+                return
+            while self._token_ring[0] != token:
+                self._token_ring.rotate(-1)
+
+    def _mark_exhausted(self, response: requests.Response) -> bool:
+        authorization = response.request.headers.get("Authorization", "")
+        token = authorization[len("Bearer "):]
+        reset = response.headers.get("X-RateLimit-Reset")
+        now = int(time.time())
+        with self._token_lock:
+            self._exhausted[token] = int(reset) if reset and reset.isdigit() else now + 60
+            return any(self._exhausted.get(other, 0) <= now for other in self.tokens)
+
+    def _get_blob(self, sha: Optional[str]) -> Optional[bytes]:
+        if not sha:
+            return None
+        with self._blob_lock:
+            content = self._blob_cache.get(sha)
+            if content is not None:
+                self._blob_cache.move_to_end(sha)
+            return content
+
+    def _store_blob(self, sha: Optional[str], content: bytes) -> None:
+        if not sha or len(content) > _BLOB_CACHE_MAX_BODY:
+            return
+        with self._blob_lock:
+            previous = self._blob_cache.pop(sha, None)
+            if previous is not None:
+                self._blob_bytes -= len(previous)
+            self._blob_cache[sha] = content
+            self._blob_bytes += len(content)
+            while self._blob_bytes > _BLOB_CACHE_MAX_BYTES:
+                _, evicted = self._blob_cache.popitem(last=False)
+                self._blob_bytes -= len(evicted)
+
+    def _store_etag(self, key: str, etag: str, body: bytes) -> None:
+        size = len(key) + len(etag) + len(body)
+        if size > _ETAG_CACHE_MAX_BODY:
+            return
+        with self._etag_lock:
+            self._etag_bytes -= self._etag_sizes.pop(key, 0)
+            self._etag_cache[key] = (etag, body, time.time())
+            self._etag_sizes[key] = size
+            self._etag_bytes += size
+            self._trim_etag_cache()
+
+    def _trim_etag_cache(self) -> None:
+        # Called with _etag_lock held
+        while self._etag_bytes > _ETAG_CACHE_MAX_BYTES:
+            key, size = self._etag_sizes.popitem(last=False)
+            self._etag_bytes -= size
+            self._etag_cache.pop(key, None)
+
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, stream: bool = False) -> requests.Response:
+        # The sorted query string is built once and serves both as part of
+        # the cache key and as the URL sent, so requests does not encode
+        # the parameters again. Streamed bodies are never buffered for the
+        # cache, so only non-streamed requests are revalidated
+        request_headers = dict(headers or {})
+        request_headers.update(self._next_headers())
+        query = urlencode(sorted(params.items())) if params else ""
+        key = "{} {}?{}".format(
+            request_headers.get("Accept", self.headers["Accept"]),
+            url,
+            query
+        )
+        if query:
+            url = f"{url}?{query}"
+
+        cached = None
+        if not stream:
+            with self._etag_lock:
+                cached = self._etag_cache.get(key)
+                if cached:
+                    self._etag_sizes.move_to_end(key)
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+
+        for attempt in range(2):
+            self._limiter.acquire()
+            response = self.session.get(url, headers=request_headers, timeout=self.timeout, stream=stream)
+            if not self._apply_rate_limit_headers(response) or attempt:
+                break
+            # Secondary rate limit: retry once after the Retry-After pause
+            response.close()
+
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            response._content = cached[1]
+            response._content_consumed = True
+            response.headers["Content-Length"] = str(len(cached[1]))
+            return response
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag and not stream:
+            self._store_etag(key, etag, response.content)
+
+        return response
+
+    def _apply_rate_limit_headers(self, response: requests.Response) -> bool:
+        # Returns True when the request was rejected by a secondary rate
+        # limit and can be retried once the gate reopens
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            self._limiter.close_until(time.time() + int(retry_after))
+            logger.warning(f"[!] Secondary rate limit hit. Pausing requests for {retry_after}s")
+            return response.status_code in (403, 429)
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        limit = response.headers.get("X-RateLimit-Limit")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if (
+            response.headers.get("X-RateLimit-Resource", "core") == "core"
+            and all(value and value.isdigit() for value in (remaining, limit, reset))
+        ):
+            self._limiter.pace(int(remaining), int(limit), int(reset))
+
+        if (
+            remaining == "0"
+            and response.headers.get("X-RateLimit-Resource", "core") == "core"
+            and not self._mark_exhausted(response)
+        ):
+            if reset and reset.isdigit():
+                wait = self._limiter.close_until(int(reset) + 1)
+                logger.warning(f"[!] API quota exhausted. Pausing requests for {max(1, int(wait))}s")
+        return False
+
+    def get_rate_limits(self, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.rate_limit_url,
-                headers=self.headers,
+                headers=headers,
                 timeout=self.timeout
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get("resources", {})
             else:
-                print(highlight(
+                logger.warning(
                     f"[!] Error fetching rate limits: "
-                    f"{response.status_code} - {response.text[:200]}",
-                    Fore.YELLOW
-                ))
+                    f"{response.status_code} - {response.text[:200]}"
+                )
                 return None
         except Exception as error:
-            print(highlight(
-                f"[!] Exception while fetching rate limits: {error}",
-                Fore.YELLOW
-            ))
+            logger.warning(
+                f"[!] Exception while fetching rate limits: {error}"
+            )
             return None
 
-    def ensure_rate_limit(self, needed: int = 1, prefer_code_search: bool = True) -> None:
-        resources = self.get_rate_limits()
-
-        if not resources:
-            print(highlight(
-                "[i] Cannot check rate limits; applying conservative 5s wait.",
-                Fore.YELLOW
-            ))
-            time.sleep(5)
+    def _record_rate_limit(self, response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if not (remaining and remaining.isdigit() and reset and reset.isdigit()):
             return
+        authorization = response.request.headers.get("Authorization", "")
+        token = authorization[len("Bearer "):]
+        self._rl_snapshots[token] = (int(remaining), int(reset), time.monotonic())
+
+    def _snapshot_token(self, needed: int) -> Optional[str]:
+        now = time.monotonic()
+        wall = time.time()
+        best = None
+        for token, (remaining, reset, checked_at) in list(self._rl_snapshots.items()):
+            if now - checked_at > _RATE_LIMIT_SNAPSHOT_TTL or reset <= wall:
+                continue
+            if remaining >= needed and (best is None or remaining > best[1]):
+                best = (token, remaining)
+        return best[0] if best else None
 
-        candidates = []
-        if prefer_code_search and "code_search" in resources:
-            candidates.append(("code_search", resources["code_search"]))
-        if "search" in resources:
-            candidates.append(("search", resources["search"]))
-        if not candidates and "core" in resources:
-            candidates.append(("core", resources["core"]))
+    def ensure_rate_limit(self, needed: int = 1, prefer_code_search: bool = True) -> None:
+        with self._rate_limit_lock:
+            if prefer_code_search:
+                token = self._snapshot_token(needed)
+                if token:
+                    self._use_token(token)
+                    return
+
+            snapshots = []
+            for token in self.tokens:
+                resources = self.get_rate_limits(token if len(self.tokens) > 1 else None)
+                if resources:
+                    snapshots.append((token, resources))
+
+            if not snapshots:
+                logger.warning(
+                    "[i] Cannot check rate limits; applying conservative 5s wait."
+                )
+                time.sleep(5)
+                return
+
+            candidates = []
+            for token, resources in snapshots:
+                if prefer_code_search and "code_search" in resources:
+                    candidates.append((token, "code_search", resources["code_search"]))
+                elif "search" in resources:
+                    candidates.append((token, "search", resources["search"]))
+                elif "core" in resources:
+                    candidates.append((token, "core", resources["core"]))
+
+            if not candidates:
+                return
 
-        for resource_name, resource_info in candidates:
+            if prefer_code_search:
+                checked_at = time.monotonic()
+                for token, resource_name, resource_info in candidates:
+                    if resource_name != "core":
+                        self._rl_snapshots[token] = (
+                            int(resource_info.get("remaining", 0)),
+                            int(resource_info.get("reset", 0)),
+                            checked_at
+                        )
+
+            token, resource_name, resource_info = max(
+                candidates, key=lambda candidate: candidate[2].get("remaining", 0)
+            )
             remaining = resource_info.get("remaining", 0)
-            reset_timestamp = resource_info.get("reset", 0)
             if remaining >= needed:
-                return
-            else:
-                wait_seconds = max(0, int(reset_timestamp) - int(time.time()) + 1)
-                reset_iso = datetime.fromtimestamp(
-                    int(reset_timestamp), timezone.utc
-                ).isoformat()
-                print(highlight(
-                    f"[!] Quota '{resource_name}' insufficient "
-                    f"({remaining} < {needed}). Reset at {reset_iso}. Waiting {wait_seconds}s...",
-                    Fore.YELLOW
-                ))
-                time.sleep(wait_seconds)
+                self._use_token(token)
                 return
 
-    def search_code(self, query: str, per_page: int = 30, max_results: int = 200, sleep_between_pages: float = 1.0) -> List[Dict[str, Any]]:
+            # Every token is short on quota; wait for the earliest reset
+            token, resource_name, resource_info = min(
+                candidates, key=lambda candidate: int(candidate[2].get("reset", 0))
+            )
+            remaining = resource_info.get("remaining", 0)
+            reset_timestamp = resource_info.get("reset", 0)
+            wait_seconds = max(0, int(reset_timestamp) - int(time.time()) + 1)
+            reset_iso = datetime.fromtimestamp(
+                int(reset_timestamp), timezone.utc
+            ).isoformat()
+            logger.warning(
+                f"[!] Quota '{resource_name}' insufficient "
+                f"({remaining} < {needed}). Reset at {reset_iso}. Waiting {wait_seconds}s..."
+            )
+            time.sleep(wait_seconds)
+            self._use_token(token)
+
+    def search_code(self, query: str, per_page: int = 100, max_results: int = 200, sleep_between_pages: float = 1.0, use_cache: bool = True, on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> List[Dict[str, Any]]:
+        # on_page receives each page's results as soon as they are parsed,
+        # so callers can start on them while later pages are fetched
+        cache_key = f"{self._search_namespace}:{per_page}:{max_results}:{query}"
+        if use_cache:
+            with self._search_lock:
+                cached = self._search_cache.get(cache_key)
+            if cached and time.time() - cached[0] < self.search_cache_ttl:
+                # Callers add fields to the results, so the cached entry
+                # is handed out as copies
+                results = [dict(item) for item in cached[1]]
+                logger.info(f"[+] Found {len(results)} results for query (cached)")
+                _flush_log()
+                if on_page and results:
+                    on_page(results)
+                return results
+
         page = 1
         results = []
-        search_headers = self.headers.copy()
-        search_headers["Accept"] = "application/vnd.github.text-match+json"
-
-        with tqdm(total=max_results, desc="Searching (GitHub API)", unit="items", leave=False) as progress_bar:
+        # Copies taken before on_page sees a page, so contents fetched
+        # for it are never written to the search cache
+        search_fields = []
+        completed = True
+        search_headers = {"Accept": "application/vnd.github.text-match+json"}
+
+        # One page is fetched ahead while the current one is processed; the
+        # worker also does the inter-page wait and quota check
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                tqdm(total=max_results, desc="Searching (GitHub API)", unit="items", leave=False) as progress_bar:
+            next_page = None
+            # The first page is sent without probing /rate_limit: its own
+            # headers seed the quota snapshot, and a 403 is handled below
+            speculative = True
 
             while len(results) < max_results:
-                self.ensure_rate_limit(needed=1, prefer_code_search=True)
                 params = {"q": query, "per_page": per_page, "page": page}
 
                 try:
-                    response = requests.get(
-                        self.search_url,
-                        headers=search_headers,
-                        params=params,
-                        timeout=self.timeout
-                    )
+                    if next_page is not None:
+                        response, items = next_page.result()
+                        next_page = None
+                    else:
+                        response, items = self._fetch_search_page(params, search_headers, check_quota=not speculative)
+                        speculative = False
                 except Exception as error:
-                    print(highlight(f"[!] Exception during search: {error}", Fore.RED))
+                    logger.error(f"[!] Exception during search: {error}")
+                    completed = False
                     break
 
+                self._record_rate_limit(response)
                 self._display_rate_limit_info(response, progress_bar)
 
                 if response.status_code == 403:
-                    self._handle_rate_limit_error(response, progress_bar)
+                    # Rotate to another token when one still has quota;
+                    # only wait once the whole pool is exhausted
+                    if not self._mark_exhausted(response):
+                        self._handle_rate_limit_error(response, progress_bar)
+                        with self._token_lock:
+                            self._exhausted.clear()
                     continue
 
                 if response.status_code != 200:
@@ -133,34 +641,60 @@ class GitHubClient:
                         f"GitHub API error {response.status_code}: {response.text[:200]}"
                     )
 
-                data = response.json()
-                items = data.get("items", [])
                 if not items:
                     break
 
-                for item in items:
-                    if len(results) >= max_results:
-                        break
-                    snippet = self._extract_snippet(item)
-                    results.append({
-                        "repository": item["repository"]["full_name"],
-                        "path": item["path"],
-                        "html_url": item.get("html_url") or item.get("url"),
-                        "snippet": snippet,
-                        "sha": item.get("sha", ""),
-                        "score": item.get("score", 0)
-                    })
-                    progress_bar.update(1)
+                if len(items) >= per_page and len(results) + len(items) < max_results:
+                    next_page = executor.submit(
+                        self._fetch_search_page,
+                        {"q": query, "per_page": per_page, "page": page + 1},
+                        search_headers,
+                        sleep_between_pages
+                    )
+
+                taken = items[:max_results - len(results)]
+                results.extend(taken)
+                search_fields.extend(dict(item) for item in taken)
+                progress_bar.update(len(taken))
+                if on_page and taken:
+                    on_page(taken)
 
                 if len(items) < per_page:
                     break
 
                 page += 1
-                time.sleep(sleep_between_pages)
 
-        print(highlight(f"[+] Found {len(results)} results for query", Fore.GREEN))
+        if use_cache and completed:
+            with self._search_lock:
+                self._prune_search_cache()
+                self._search_cache[cache_key] = (time.time(), search_fields)
+
+        logger.info(f"[+] Found {len(results)} results for query")
+        _flush_log()
         return results
 
+    def _fetch_search_page(self, params: Dict[str, Any], headers: Dict[str, str], delay: float = 0.0, check_quota: bool = True) -> Tuple[requests.Response, List[Dict[str, Any]]]:
+        # A successful page is decoded here as well, so for prefetched
+        # pages the parsing happens on the worker instead of the caller
+        if delay:
+            time.sleep(delay)
+        if check_quota:
+            self.ensure_rate_limit(needed=1, prefer_code_search=True)
+        response = self._cached_get(self.search_url, params=params, headers=headers)
+        if response.status_code != 200:
+            return response, []
+        return response, [
+            {
+                "repository": item["repository"]["full_name"],
+                "path": item["path"],
+                "html_url": item.get("html_url") or item.get("url"),
+                "snippet": self._extract_snippet(item),
+                "sha": item.get("sha", ""),
+                "score": item.get("score", 0)
+            }
+            for item in _json_loads(response.content).get("items", [])
+        ]
+
     def _extract_snippet(self, item: Dict[str, Any]) -> str:
         text_matches = item.get("text_matches", [])
         if text_matches:
@@ -180,62 +714,264 @@ class GitHubClient:
                 now_ts = int(time.time())
                 diff = max(0, reset_ts - now_ts)
                 mins, secs = divmod(diff, 60)
-                reset_iso = datetime.fromtimestamp(reset_ts, timezone.utc).strftime("%H:%M:%S")
-                info = (
-                    f"Rate limit: {Style.BRIGHT}{Fore.BLUE}{remaining}{Style.RESET_ALL}/{Style.BRIGHT}{Fore.GREEN}{limit}{Style.RESET_ALL} | Reset in: {mins}m {secs}s ({reset_iso} UTC)"
+                info = _RATE_LIMIT_TEMPLATE.format(
+                    remaining=remaining, limit=limit, mins=mins, secs=secs,
+                    iso=_format_reset_time(reset_ts)
                 )
                 if progress_bar:
                     progress_bar.set_description(f"Searching (GitHub API) | {info}")
                 else:
-                    print(highlight(f"[i] {info}", Fore.BLUE))
+                    logger.info(f"[i] {info}", extra={"color": Fore.BLUE})
         except Exception:
             pass
 
     def _handle_rate_limit_error(self, response: requests.Response, progress_bar: Optional[tqdm] = None) -> None:
         reset = response.headers.get("X-RateLimit-Reset")
         if not reset:
-            print(highlight("[!] 403 Forbidden - no reset header found.", Fore.YELLOW))
+            logger.warning("[!] 403 Forbidden - no reset header found.")
             time.sleep(10)
             return
 
         reset_ts = int(reset)
         wait_seconds = max(10, reset_ts - int(time.time()) + 1)
-        reset_iso = datetime.fromtimestamp(reset_ts, timezone.utc).strftime("%H:%M:%S")
+        reset_iso = _format_reset_time(reset_ts)
 
         msg = f"Rate limit exceeded. Waiting {Fore.YELLOW}{wait_seconds}{Fore.RESET}s until reset ({reset_iso} UTC)"
         
         if progress_bar:
-            for remaining in range(wait_seconds, 0, -1):
-                progress_bar.set_description(
-                    f"Waiting for rate limit reset ({Style.BRIGHT}{Fore.YELLOW}{remaining}{Style.RESET_ALL}s left)"
-                )
-                time.sleep(1)
+            def show(remaining: int) -> None:
+                progress_bar.set_description(_WAIT_TEMPLATE.format(remaining=remaining))
         else:
-            for remaining in range(wait_seconds, 0, -1):
+            def show(remaining: int) -> None:
                 print(f"\r[Waiting] {remaining}s until reset...", end="", flush=True)
-                time.sleep(1)
+
+        _flush_log()
+
+        # The wait itself is a single sleep; a ticker thread only redraws
+        # the countdown when the displayed second changes
+        stop = threading.Event()
+        ticker = threading.Thread(target=self._countdown, args=(show, wait_seconds, stop), daemon=True)
+        ticker.start()
+        try:
+            time.sleep(wait_seconds)
+        finally:
+            stop.set()
+            ticker.join()
+
+        if not progress_bar:
             print()
 
-    def download_file_content(self, repository: str, path: str) -> Optional[bytes]:
+    def _countdown(self, show: Any, wait_seconds: int, stop: threading.Event) -> None:
+        deadline = time.monotonic() + wait_seconds
+        shown = None
+        while not stop.is_set():
+            remaining = max(1, int(deadline - time.monotonic() + 0.999))
+            if remaining != shown:
+                show(remaining)
+                shown = remaining
+            stop.wait(deadline - time.monotonic() - (remaining - 1))
+
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        try:
+            self._limiter.acquire()
+            response = self.session.post(
+                self.graphql_url,
+                data=_json_dumps({"query": query, "variables": variables or {}}),
+                headers={"Content-Type": "application/json", **self._next_headers()},
+                timeout=self.timeout
+            )
+            self._apply_rate_limit_headers(response)
+            if response.status_code == 200:
+                return _json_loads(response.content).get("data")
+            if response.status_code == 404:
+                self._graphql_available = False
+            logger.warning(
+                f"[!] GraphQL request failed: {response.status_code} - {response.text[:200]}"
+            )
+            return None
+        except Exception as error:
+            logger.warning(f"[!] Exception during GraphQL request: {error}")
+            return None
+
+    def fetch_contents(self, results: List[Dict[str, Any]], batch_size: int = 50) -> int:
+        # One aliased GraphQL query returns the blobs for a whole batch of
+        # search results; entries left without "content" (binary,
+        # truncated, missing or not valid UTF-8) need a REST download.
+        # Entries whose blob was found also get its "size" and "binary"
+        fetched = 0
+        for start in range(0, len(results), batch_size):
+            batch = []
+            for result in results[start:start + batch_size]:
+                content = self._get_blob(result.get("sha"))
+                if content is not None:
+                    result["content"] = content
+                    fetched += 1
+                elif result.get("sha"):
+                    batch.append(result)
+
+            # Each distinct blob is requested once per batch
+            unique: Dict[str, Dict[str, Any]] = {}
+            for result in batch:
+                unique.setdefault(result["sha"], result)
+            if not unique or not self._graphql_available:
+                continue
+
+            declarations = []
+            fields = []
+            variables: Dict[str, Any] = {}
+            for index, result in enumerate(unique.values()):
+                owner, _, name = result["repository"].partition("/")
+                declarations.append(f"$o{index}: String!, $n{index}: String!, $s{index}: GitObjectID!")
+                fields.append(
+                    f"f{index}: repository(owner: $o{index}, name: $n{index}) "
+                    f"{{ object(oid: $s{index}) {{ ... on Blob {{ text isBinary isTruncated byteSize }} }} }}"
+                )
+                variables.update({f"o{index}": owner, f"n{index}": name, f"s{index}": result["sha"]})
+
+            query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+            data = self._graphql(query, variables)
+            if not data:
+                continue
+
+            contents: Dict[str, bytes] = {}
+            details: Dict[str, Tuple[Optional[int], bool]] = {}
+            for index, sha in enumerate(unique):
+                blob = (data.get(f"f{index}") or {}).get("object")
+                if blob:
+                    details[sha] = (blob.get("byteSize"), bool(blob.get("isBinary")))
+                if not blob or blob.get("isBinary") or blob.get("isTruncated") or blob.get("text") is None:
+                    continue
+                content = blob["text"].encode("utf-8")
+                if blob.get("byteSize") is not None and len(content) != blob["byteSize"]:
+                    continue
+                contents[sha] = content
+                self._store_blob(sha, content)
+
+            for result in batch:
+                if result["sha"] in details:
+                    result["size"], result["binary"] = details[result["sha"]]
+                content = contents.get(result["sha"])
+                if content is not None:
+                    result["content"] = content
+                    fetched += 1
+
+        return fetched
+
+    def download_file_content(self, repository: str, path: str, sha: Optional[str] = None) -> Optional[bytes]:
+        content = self._get_blob(sha)
+        if content is not None:
+            return content
+
+        url = self.contents_url.format(repo=repository, path=path)
+        try:
+            # Not streamed, so the body is kept in the ETag cache and an
+            # unchanged file is answered with a 304
+            response = self._cached_get(url, headers=self._raw_headers)
+            if response.status_code == 200:
+                self._store_blob(sha, response.content)
+                return response.content
+
+            logger.warning(
+                f"[!] Failed to download {repository}/{path}: Status {response.status_code}"
+            )
+            return None
+        except Exception as error:
+            logger.error(
+                f"[!] Exception downloading {repository}/{path}: {error}"
+            )
+            return None
+
+    def download_many(self, items: Iterable[Dict[str, Any]], max_workers: int = 10) -> Iterator[Tuple[Dict[str, Any], Optional[bytes]]]:
+        with ThreadPoolExecutor(max_workers=min(max_workers, _POOL_MAXSIZE)) as executor:
+            futures = {
+                executor.submit(self.download_file_content, item["repository"], item["path"], item.get("sha")): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        _flush_log()
+
+    def download_file_stream(self, repository: str, path: str, chunk_size: int = _STREAM_CHUNK_SIZE, sha: Optional[str] = None, max_size: Optional[int] = None) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        # Bodies whose known size exceeds max_size are dropped before any
+        # of them is read
+        content = self._get_blob(sha)
+        if content is not None:
+            if max_size is not None and len(content) > max_size:
+                return None
+            return iter((content,)), len(content)
+
         url = self.contents_url.format(repo=repository, path=path)
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._cached_get(url, headers=self._raw_headers, stream=True)
             if response.status_code == 200:
-                data = response.json()
-                download_url = data.get("download_url")
-                if download_url:
-                    content_response = requests.get(download_url, timeout=self.timeout)
-                    if content_response.status_code == 200:
-                        return content_response.content
-
-            print(highlight(
-                f"[!] Failed to download {repository}/{path}: Status {response.status_code}",
-                Fore.YELLOW
-            ))
+                length = response.headers.get("Content-Length")
+                size = int(length) if length and length.isdigit() else None
+                if max_size is not None and size is not None and size > max_size:
+                    response.close()
+                    return None
+                if sha and size is not None and size <= _BLOB_CACHE_MAX_BODY:
+                    return self._iter_and_store(response, chunk_size, sha), size
+                return self._iter_response(response, chunk_size), size
+            response.close()
+
+            logger.warning(
+                f"[!] Failed to download {repository}/{path}: Status {response.status_code}"
+            )
             return None
         except Exception as error:
-            print(highlight(
-                f"[!] Exception downloading {repository}/{path}: {error}",
-                Fore.RED
-            ))
+            logger.error(
+                f"[!] Exception downloading {repository}/{path}: {error}"
+            )
             return None
+
+    def _iter_response(self, response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def _iter_and_store(self, response: requests.Response, chunk_size: int, sha: str) -> Iterator[bytes]:
+        chunks = []
+        for chunk in self._iter_response(response, chunk_size):
+            chunks.append(chunk)
+            yield chunk
+        self._store_blob(sha, b"".join(chunks))
+
+
+class AsyncGitHubClient:
+    """
+    Asyncio front-end for GitHubClient.
+
+    Requests are issued through the wrapped client's pooled session from
+    worker threads, so downloads can be awaited concurrently without a
+    second HTTP stack. Concurrency is bounded by a semaphore.
+    """
+
+    def __init__(self, client: GitHubClient, concurrency: int = 10):
+        self.client = client
+        self.concurrency = concurrency
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.client.close()
+
+    async def search_code(self, query: str, per_page: int = 100, max_results: int = 200, sleep_between_pages: float = 1.0) -> List[Dict[str, Any]]:
+        # Pages are linked, so pagination stays sequential; running it in a
+        # worker thread keeps the page waits off the event loop
+        return await asyncio.to_thread(
+            self.client.search_code, query, per_page, max_results, sleep_between_pages
+        )
+
+    async def download_file_content(self, repository: str, path: str, sha: Optional[str] = None) -> Optional[bytes]:
+        return await asyncio.to_thread(self.client.download_file_content, repository, path, sha)
+
+    async def download_many(self, items: Iterable[Dict[str, Any]], concurrency: Optional[int] = None) -> List[Tuple[Dict[str, Any], Union[Optional[bytes], BaseException]]]:
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def fetch(item: Dict[str, Any]) -> Optional[bytes]:
+            async with semaphore:
+                return await self.download_file_content(item["repository"], item["path"], item.get("sha"))
+
+        items = list(items)
+        contents = await asyncio.gather(*(fetch(item) for item in items), return_exceptions=True)
+        return list(zip(items, contents))
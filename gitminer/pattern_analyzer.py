@@ -5,12 +5,416 @@ This module provides pattern matching and analysis capabilities
 for detecting sensitive information in files.
 """
 
+import mmap
+import os
+import queue
 import re
-from typing import List, Tuple, Dict, Optional
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple, Dict, Optional
 
 from colorama import Fore
 
-from gitminer.utils import highlight
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+from gitminer.utils import highlight, compile_pattern
+
+# Line boundaries recognised by str.splitlines()
+_LINE_BREAK_RE = re.compile(r'\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]')
+
+# Constructs whose result on a single line can differ from the result at
+# the same spot inside the whole file
+_CONTEXT_DEPENDENT_RE = re.compile(r'\^|\$|\\A|\\Z|\(\?<?!')
+
+
+# Flags that can be applied to a single group of an alternation
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, 'i'),
+    (re.MULTILINE, 'm'),
+    (re.DOTALL, 's'),
+    (re.VERBOSE, 'x'),
+)
+
+
+# Assignment after a parameter name: optional whitespace, then ':' or '='
+# and the (optionally quoted) value
+_ASSIGN_RE = re.compile(r'\s*[:=][\s:=]*["\']?([^"\'\s;,#]+)["\']?')
+
+
+def _is_context_free(source: str) -> bool:
+    """
+    Check whether a regex matches a line the same way inside the file.
+
+    Patterns without anchors or negative lookarounds that match within a
+    line also match at that spot in the full text, so a search over the
+    whole file finds every line they can match.
+
+    Args:
+        source: Regex source string
+
+    Returns:
+        True if the pattern can be located with a whole-file search
+    """
+    stripped = re.sub(r'\\[^AZ]', '', source).replace('[^', '[')
+    return not _CONTEXT_DEPENDENT_RE.search(stripped)
+
+
+def _build_union(patterns: Iterable[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Combine compiled patterns into a single alternation.
+
+    Each pattern keeps its own flags as a scoped inline group, so the
+    union matches wherever at least one of the patterns matches.
+
+    Args:
+        patterns: Compiled regex patterns to combine
+
+    Returns:
+        Compiled alternation, or None if the patterns cannot be combined
+    """
+    alternatives = []
+    for pattern in patterns:
+        flags = ''.join(
+            letter
+            for flag, letter in _SCOPED_FLAGS
+            if pattern.flags & flag
+        )
+        alternatives.append(f"(?{flags}:{pattern.pattern})")
+    
+    if not alternatives:
+        return None
+    
+    try:
+        return re.compile('|'.join(alternatives))
+    except re.error:
+        return None
+
+
+def _hyperscan_flags(pattern: re.Pattern) -> int:
+    """
+    Translate the flags of a compiled regex into Hyperscan flags.
+
+    Args:
+        pattern: Compiled regex
+
+    Returns:
+        Hyperscan compile flags for the expression
+    """
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    if pattern.flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    if pattern.flags & re.MULTILINE:
+        flags |= hyperscan.HS_FLAG_MULTILINE
+    if pattern.flags & re.DOTALL:
+        flags |= hyperscan.HS_FLAG_DOTALL
+    return flags
+
+
+# Number of leading bytes checked for NUL to detect binary files
+_BINARY_SNIFF_SIZE = 8192
+
+
+# UTF-8 encodings of the only non-ASCII characters whose lower() contains
+# ASCII letters (U+0130 and U+212A)
+_ASCII_LOWERING_BYTES = (b'\xc4\xb0', b'\xe2\x84\xaa')
+
+
+# Access-pattern hint for file mappings; not available on every platform
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+
+
+def _read_text(file_path: str, keyword: Optional[bytes] = None,
+               case_sensitive: bool = True,
+               skip_binary: bool = False) -> Optional[str]:
+    """
+    Read and decode a file through a read-only memory map.
+
+    The text is decoded straight from the mapping, so no intermediate
+    copy of the raw bytes is kept alongside the decoded string. The
+    mapping is read front to back once, which is what the kernel is
+    told so it reads ahead aggressively and drops pages behind.
+
+    Args:
+        file_path: Path to the file to read
+        keyword: ASCII keyword that must occur in the file, if any
+        case_sensitive: Whether the keyword check is case-sensitive
+        skip_binary: Whether to skip files that look binary
+
+    Returns:
+        Decoded content, or None when the keyword cannot occur in it or
+        the file is skipped as binary
+    """
+    with open(file_path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            return None if keyword else ''
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _MADV_SEQUENTIAL is not None:
+                data.madvise(_MADV_SEQUENTIAL)
+            
+            if skip_binary and _looks_binary(data, len(data)):
+                return None
+            
+            if keyword is not None and not _may_contain(
+                data, keyword, case_sensitive
+            ):
+                return None
+            
+            return _decode(data)
+
+
+def _read_text_sniffed(file_path: str) -> Tuple[str, bool]:
+    """
+    Read and decode a file, telling whether it looks binary.
+
+    Args:
+        file_path: Path to the file to read
+
+    Returns:
+        Tuple of (decoded content, whether the file looks binary)
+    """
+    with open(file_path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            return '', False
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _MADV_SEQUENTIAL is not None:
+                data.madvise(_MADV_SEQUENTIAL)
+            
+            return _decode(data), _looks_binary(data, len(data))
+
+
+def _looks_binary(data, length: int) -> bool:
+    """
+    Check whether file content looks binary.
+
+    Like git, a NUL byte near the start of the file marks it as binary.
+
+    Args:
+        data: Raw content (bytes or any buffer)
+        length: Number of valid bytes in data
+
+    Returns:
+        True if a NUL byte occurs in the first _BINARY_SNIFF_SIZE bytes
+    """
+    return data.find(b'\x00', 0, min(length, _BINARY_SNIFF_SIZE)) != -1
+
+
+def _decode(data) -> str:
+    """
+    Decode file content as UTF-8, falling back to latin-1.
+
+    Args:
+        data: Raw content (bytes or any buffer)
+
+    Returns:
+        Decoded text
+    """
+    try:
+        return str(data, 'utf-8')
+    except UnicodeDecodeError:
+        return str(data, 'latin-1', 'ignore')
+
+
+def _read_into(
+    file_path: str,
+    buffers: "queue.SimpleQueue[bytearray]"
+) -> Tuple[bytearray, int]:
+    """
+    Read a whole file into a buffer taken from a shared pool.
+
+    Buffers are reused across files and only grow when a file is larger
+    than any seen before, so reading does not allocate per file.
+
+    Args:
+        file_path: Path to the file to read
+        buffers: Pool of reusable buffers
+
+    Returns:
+        Tuple of (buffer, number of bytes read); the caller puts the
+        buffer back into the pool when done with it
+    """
+    try:
+        buffer = buffers.get_nowait()
+    except queue.Empty:
+        buffer = bytearray()
+    
+    try:
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if len(buffer) < size:
+                buffer = bytearray(size)
+            with memoryview(buffer) as view:
+                length = file.readinto(view[:size])
+    except BaseException:
+        buffers.put(buffer)
+        raise
+    
+    return buffer, length
+
+
+def _may_contain(data: mmap.mmap, keyword: bytes,
+                 case_sensitive: bool) -> bool:
+    """
+    Check whether a decoded line of the file could contain an ASCII keyword.
+
+    Args:
+        data: Mapped file content
+        keyword: ASCII keyword
+        case_sensitive: Whether the search is case-sensitive
+
+    Returns:
+        False only when no line can contain the keyword
+    """
+    if case_sensitive:
+        return data.find(keyword) != -1
+    
+    if re.search(re.escape(keyword), data, re.IGNORECASE) is not None:
+        return True
+    
+    return any(data.find(special) != -1 for special in _ASCII_LOWERING_BYTES)
+
+
+_HIGH_INDICATORS = (
+    "PRIVATE", "SECRET", "AWS", "TOKEN",
+    "SSH_PRIVATE_KEY", "PRIVATE_KEY", "CERTIFICATE"
+)
+
+_MEDIUM_INDICATORS = (
+    "PASSWORD", "PASS", "JWT", "API",
+    "GITHUB_TOKEN", "ACCESS_KEY", "OAUTH"
+)
+
+
+def _build_automaton(indicators: Tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over severity indicators.
+
+    Args:
+        indicators: Substrings to look for
+
+    Returns:
+        Automaton, or None when pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for indicator in indicators:
+        automaton.add_word(indicator, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+_HIGH_AUTOMATON = _build_automaton(_HIGH_INDICATORS)
+_MEDIUM_AUTOMATON = _build_automaton(_MEDIUM_INDICATORS)
+
+
+def _contains_any(label_upper: str, indicators: Tuple[str, ...],
+                  automaton) -> bool:
+    """
+    Check whether a label contains any of the indicators.
+
+    Args:
+        label_upper: Uppercased label/pattern name
+        indicators: Substrings to look for
+        automaton: Aho-Corasick automaton over the indicators, or None
+
+    Returns:
+        True if at least one indicator occurs in the label
+    """
+    if automaton is not None:
+        return next(automaton.iter(label_upper), None) is not None
+    
+    return any(indicator in label_upper for indicator in indicators)
+
+
+@lru_cache(maxsize=512)
+def _classify(label_upper: str) -> str:
+    """
+    Classify an uppercased label; labels repeat, so results are cached.
+
+    Args:
+        label_upper: Uppercased label/pattern name
+
+    Returns:
+        Severity level: "HIGH", "MEDIUM", or "LOW"
+    """
+    if _contains_any(label_upper, _HIGH_INDICATORS, _HIGH_AUTOMATON):
+        return "HIGH"
+    
+    if _contains_any(label_upper, _MEDIUM_INDICATORS, _MEDIUM_AUTOMATON):
+        return "MEDIUM"
+    
+    return "LOW"
+
+
+# Analyzer rebuilt in each scan_files worker process
+_worker_analyzer: Optional["PatternAnalyzer"] = None
+
+
+def _init_worker(
+    pattern_sources: List[Tuple[str, str, int]],
+    labels: Dict[str, str]
+) -> None:
+    """
+    Recompile the patterns inside a scan_files worker process.
+
+    Args:
+        pattern_sources: List of (name, regex source, flags)
+        labels: Dictionary mapping regex strings to label names
+    """
+    global _worker_analyzer
+    patterns = {
+        name: re.compile(source, flags)
+        for name, source, flags in pattern_sources
+    }
+    _worker_analyzer = PatternAnalyzer(patterns=patterns, labels=labels)
+
+
+def _scan_one(
+    task: Tuple[str, int]
+) -> List[Tuple[str, str, str, Optional[int]]]:
+    """
+    Scan one file with the worker's analyzer.
+
+    Args:
+        task: Tuple of (file_path, max_context_length)
+
+    Returns:
+        Findings from PatternAnalyzer.scan_file
+    """
+    file_path, max_context_length = task
+    return _worker_analyzer.scan_file(file_path, max_context_length)
+
+
+def _analyze_one(
+    task: Tuple[str, str, bool, int]
+) -> Tuple[List[Tuple[int, str]], List[Tuple[str, str, str, Optional[int]]]]:
+    """
+    Search a keyword in and scan one file with the worker's analyzer.
+
+    Args:
+        task: Tuple of (file_path, keyword, case_sensitive,
+            max_context_length)
+
+    Returns:
+        Tuple of (keyword matches, pattern findings)
+    """
+    file_path, keyword, case_sensitive, max_context_length = task
+    return _worker_analyzer.scan_file_with_keyword(
+        file_path, keyword, case_sensitive, max_context_length
+    )
 
 
 class PatternAnalyzer:
@@ -37,10 +441,96 @@ class PatternAnalyzer:
         self.labels = labels
         
         self.compiled_labels = {
-            re.compile(pattern): label
+            compile_pattern(pattern): label
             for pattern, label in labels.items()
         }
 
+        self._context_free = {
+            pattern: _is_context_free(pattern.pattern)
+            for pattern in list(patterns.values()) + list(self.compiled_labels)
+        }
+        
+        # One search tells whether any label can match in a file; only
+        # usable when every label can be located with a whole-file search
+        self._labels_union = None
+        if all(self._context_free[pattern] for pattern in self.compiled_labels):
+            self._labels_union = _build_union(self.compiled_labels)
+        
+        self._hs_patterns: List[re.Pattern] = []
+        self._hs_db = self._build_hyperscan_db()
+
+    def _build_hyperscan_db(self):
+        """
+        Compile the context-free patterns and labels into a Hyperscan database.
+
+        Hyperscan reports every match of every pattern in one pass over
+        the file, which is used to pick the lines each pattern or label
+        is then run on with ``re``.
+
+        Returns:
+            Block-mode Hyperscan database, or None when Hyperscan is not
+            installed or rejects one of the patterns
+        """
+        if hyperscan is None:
+            return None
+        
+        compiled = []
+        for pattern in list(self.patterns.values()) + list(self.compiled_labels):
+            if self._context_free[pattern] and pattern not in compiled:
+                compiled.append(pattern)
+        if not compiled:
+            return None
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[
+                    pattern.pattern.encode('utf-8') for pattern in compiled
+                ],
+                ids=list(range(len(compiled))),
+                flags=[_hyperscan_flags(pattern) for pattern in compiled]
+            )
+        except Exception:
+            return None
+        
+        self._hs_patterns = compiled
+        return database
+
+    def _hyperscan_spans(
+        self,
+        content: str
+    ) -> Optional[Dict[re.Pattern, List[Tuple[int, int]]]]:
+        """
+        Collect match spans for the Hyperscan-compiled patterns.
+
+        Only ASCII content is scanned, so byte offsets are character
+        offsets and Hyperscan classes agree with ``re`` on every input
+        character.
+
+        Args:
+            content: Decoded file content
+
+        Returns:
+            Dictionary mapping compiled patterns to (start, end) spans, or
+            None when the ``re`` search should be used instead
+        """
+        if self._hs_db is None or not content or not content.isascii():
+            return None
+        
+        spans = {pattern: [] for pattern in self._hs_patterns}
+        
+        def on_match(pattern_id, start, end, flags, context):
+            spans[self._hs_patterns[pattern_id]].append((start, end))
+        
+        try:
+            self._hs_db.scan(
+                content.encode('ascii'), match_event_handler=on_match
+            )
+        except Exception:
+            return None
+        
+        return spans
+
     def scan_file(
         self,
         file_path: str,
@@ -49,6 +539,8 @@ class PatternAnalyzer:
         """
         Scan a file for sensitive patterns.
 
+        Files that look binary (a NUL byte in the first 8 KiB) are skipped.
+
         Args:
             file_path: Path to the file to scan
             max_context_length: Maximum length of context to extract
@@ -60,24 +552,9 @@ class PatternAnalyzer:
         findings = []
         
         try:
-            with open(file_path, 'rb') as file:
-                raw_content = file.read()
-            
-            try:
-                content = raw_content.decode('utf-8')
-            except UnicodeDecodeError:
-                content = raw_content.decode('latin-1', errors='ignore')
-            
-            lines = content.splitlines()
-            
-            findings.extend(
-                self._scan_with_patterns(lines, max_context_length)
-            )
-            
-            findings.extend(
-                self._scan_with_labels(lines, max_context_length)
-            )
-            
+            content = _read_text(file_path, skip_binary=True)
+            if content is not None:
+                self._scan_content(content, max_context_length, findings)
         except Exception as error:
             print(highlight(
                 f"[!] Error scanning file {file_path}: {error}",
@@ -86,25 +563,281 @@ class PatternAnalyzer:
         
         return findings
 
-    def _scan_with_patterns(
+    def scan_many(
+        self,
+        file_paths: Iterable[str],
+        max_context_length: int = 500,
+        read_workers: int = 8
+    ) -> Iterator[Tuple[str, List[Tuple[str, str, str, Optional[int]]]]]:
+        """
+        Scan many files, reading them ahead on a thread pool.
+
+        File reads release the GIL, so the next files are loaded while
+        the current one is matched. At most ``4 * read_workers`` files
+        are held in memory at a time, in buffers that are reused from
+        one file to the next. Binary files are skipped as in scan_file.
+
+        Args:
+            file_paths: Paths of the files to scan
+            max_context_length: Maximum length of context to extract
+            read_workers: Number of threads reading files
+
+        Yields:
+            Tuples of (file_path, findings), in the order of file_paths
+        """
+        paths = iter(file_paths)
+        pending = deque()
+        buffers = queue.SimpleQueue()
+        
+        with ThreadPoolExecutor(max_workers=read_workers) as executor:
+            def fill() -> None:
+                while len(pending) < 4 * read_workers:
+                    path = next(paths, None)
+                    if path is None:
+                        return
+                    pending.append((
+                        path, executor.submit(_read_into, path, buffers)
+                    ))
+            
+            fill()
+            while pending:
+                file_path, future = pending.popleft()
+                fill()
+                
+                findings = []
+                try:
+                    buffer, length = future.result()
+                    content = None
+                    if not _looks_binary(buffer, length):
+                        with memoryview(buffer) as view:
+                            content = _decode(view[:length])
+                    buffers.put(buffer)
+                    
+                    if content is not None:
+                        self._scan_content(
+                            content, max_context_length, findings
+                        )
+                except Exception as error:
+                    print(highlight(
+                        f"[!] Error scanning file {file_path}: {error}",
+                        Fore.RED
+                    ))
+                
+                yield file_path, findings
+
+    def _scan_content(
+        self,
+        content: str,
+        max_context_length: int,
+        findings: List[Tuple[str, str, str, Optional[int]]],
+        lines: Optional[List[str]] = None
+    ) -> None:
+        """
+        Scan decoded file content and append the findings.
+
+        Args:
+            content: Decoded file content
+            max_context_length: Maximum length of context to extract
+            findings: List the findings are appended to
+            lines: Lines of the content, if already split
+        """
+        if lines is None:
+            lines = content.splitlines()
+        
+        for results in self._scan_text(lines, content, max_context_length):
+            findings.extend(results)
+
+    def _scan_text(
         self,
         lines: List[str],
+        content: str,
         max_context_length: int
+    ) -> Tuple[List[Tuple[str, str, str, Optional[int]]], ...]:
+        """
+        Scan decoded text with the detection patterns and the labels.
+
+        Args:
+            lines: Lines of the text
+            content: Full text the lines were split from
+            max_context_length: Maximum context length
+
+        Returns:
+            Tuple of (pattern findings, label findings)
+        """
+        line_starts = [0]
+        line_starts.extend(
+            match.end() for match in _LINE_BREAK_RE.finditer(content)
+        )
+        
+        hs_spans = self._hyperscan_spans(content)
+        
+        return (
+            self._scan_with_patterns(
+                lines, content, line_starts, max_context_length, hs_spans
+            ),
+            self._scan_with_labels(
+                lines, content, line_starts, max_context_length, hs_spans
+            )
+        )
+
+    def _pattern_sources(self) -> List[Tuple[str, str, int]]:
+        """
+        Serialize the detection patterns for worker processes.
+
+        Returns:
+            List of (name, regex source, flags)
+        """
+        return [
+            (name, pattern.pattern, pattern.flags)
+            for name, pattern in self.patterns.items()
+        ]
+
+    def scan_files(
+        self,
+        file_paths: Iterable[str],
+        workers: Optional[int] = None,
+        max_context_length: int = 500
+    ) -> List[List[Tuple[str, str, str, Optional[int]]]]:
+        """
+        Scan several files in parallel worker processes.
+
+        Regex matching is CPU-bound, so files are spread over a process
+        pool. Workers receive pattern sources and recompile them once in
+        their initializer instead of unpickling compiled patterns per task.
+
+        Args:
+            file_paths: Paths of the files to scan
+            workers: Number of worker processes (default: CPU count)
+            max_context_length: Maximum length of context to extract
+
+        Returns:
+            List of findings per file, in the order of file_paths
+        """
+        tasks = [(path, max_context_length) for path in file_paths]
+        if not tasks:
+            return []
+        
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(self._pattern_sources(), self.labels)
+        ) as executor:
+            return list(executor.map(_scan_one, tasks, chunksize=32))
+
+    def analyze_files(
+        self,
+        tasks: Iterable[Tuple[str, str]],
+        case_sensitive: bool = False,
+        workers: Optional[int] = None,
+        max_context_length: int = 500
+    ) -> Iterator[
+        Tuple[List[Tuple[int, str]], List[Tuple[str, str, str, Optional[int]]]]
+    ]:
+        """
+        Search keywords in and scan several files in worker processes.
+
+        Each file goes through scan_file_with_keyword. Results are
+        yielded in task order as soon as they are ready, so callers can
+        report early files while later ones are still being scanned.
+        With a single worker the files are handled in this process.
+
+        Args:
+            tasks: Iterable of (file_path, keyword) tuples
+            case_sensitive: Whether the keyword search is case-sensitive
+            workers: Number of worker processes (default: CPU count)
+            max_context_length: Maximum length of context to extract
+
+        Yields:
+            Tuples of (keyword matches, pattern findings) per task
+        """
+        tasks = [
+            (path, keyword, case_sensitive, max_context_length)
+            for path, keyword in tasks
+        ]
+        workers = min(workers or os.cpu_count() or 1, len(tasks))
+        
+        if workers <= 1:
+            for task in tasks:
+                yield self.scan_file_with_keyword(*task)
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._pattern_sources(), self.labels)
+        ) as executor:
+            yield from executor.map(_analyze_one, tasks, chunksize=16)
+
+    def _candidate_lines(
+        self,
+        pattern: re.Pattern,
+        content: str,
+        line_starts: List[int],
+        line_count: int,
+        spans: Optional[List[Tuple[int, int]]] = None
+    ) -> Iterable[int]:
+        """
+        Find the indexes of lines a pattern may match.
+
+        Context-free patterns are searched once over the whole content
+        and only the lines touched by a match are returned; other
+        patterns get every line.
+
+        Args:
+            pattern: Compiled regex
+            content: Full decoded file content
+            line_starts: Offset of the first character of each line
+            line_count: Number of lines in the file
+            spans: Precomputed match spans to use instead of searching
+
+        Returns:
+            Ascending line indexes (0-based)
+        """
+        if not self._context_free.get(pattern):
+            return range(line_count)
+        
+        if spans is None:
+            spans = (match.span() for match in pattern.finditer(content))
+        
+        indexes = set()
+        for start, end in spans:
+            first = bisect_right(line_starts, start) - 1
+            last = bisect_right(line_starts, max(start, end - 1)) - 1
+            indexes.update(range(first, last + 1))
+        
+        return sorted(index for index in indexes if index < line_count)
+
+    def _scan_with_patterns(
+        self,
+        lines: List[str],
+        content: str,
+        line_starts: List[int],
+        max_context_length: int,
+        hs_spans: Optional[Dict[re.Pattern, List[Tuple[int, int]]]] = None
     ) -> List[Tuple[str, str, str, Optional[int]]]:
         """
         Scan lines using compiled regex patterns.
 
         Args:
             lines: List of text lines to scan
+            content: Full decoded file content
+            line_starts: Offset of the first character of each line
             max_context_length: Maximum context length
+            hs_spans: Hyperscan match spans per pattern, if available
 
         Returns:
             List of findings
         """
         findings = []
+        hs_spans = hs_spans or {}
         
         for pattern_name, pattern in self.patterns.items():
-            for line_number, line in enumerate(lines, start=1):
+            for index in self._candidate_lines(
+                pattern, content, line_starts, len(lines),
+                hs_spans.get(pattern)
+            ):
+                line_number = index + 1
+                line = lines[index]
                 matches = pattern.finditer(line)
                 
                 for match in matches:
@@ -123,22 +856,54 @@ class PatternAnalyzer:
     def _scan_with_labels(
         self,
         lines: List[str],
-        max_context_length: int
+        content: str,
+        line_starts: List[int],
+        max_context_length: int,
+        hs_spans: Optional[Dict[re.Pattern, List[Tuple[int, int]]]] = None
     ) -> List[Tuple[str, str, str, Optional[int]]]:
         """
         Scan lines using label patterns for parameter detection.
 
         Args:
             lines: List of text lines to scan
+            content: Full decoded file content
+            line_starts: Offset of the first character of each line
             max_context_length: Maximum context length
+            hs_spans: Hyperscan match spans per pattern, if available
 
         Returns:
             List of findings
         """
         findings = []
+        hs_spans = hs_spans or {}
+        
+        if self._labels_union:
+            if hs_spans:
+                if not any(hs_spans[pattern] for pattern in self.compiled_labels):
+                    return findings
+            elif not self._labels_union.search(content):
+                return findings
+        
+        label_lines = []
+        scan_lines = set()
+        for pattern, label in self.compiled_labels.items():
+            indexes = self._candidate_lines(
+                pattern, content, line_starts, len(lines),
+                hs_spans.get(pattern)
+            )
+            if isinstance(indexes, range):
+                label_lines.append((pattern, label, None))
+                scan_lines.update(indexes)
+            else:
+                label_lines.append((pattern, label, set(indexes)))
+                scan_lines.update(indexes)
         
-        for line_number, line in enumerate(lines, start=1):
-            for pattern, label in self.compiled_labels.items():
+        for index in sorted(scan_lines):
+            line_number = index + 1
+            line = lines[index]
+            for pattern, label, indexes in label_lines:
+                if indexes is not None and index not in indexes:
+                    continue
                 matches = pattern.finditer(line)
                 
                 for match in matches:
@@ -182,19 +947,10 @@ class PatternAnalyzer:
         Returns:
             Extracted value or None
         """
-        remaining = line[start_pos:].lstrip()
+        assignment = _ASSIGN_RE.match(line, start_pos)
         
-        if not remaining:
-            return None
-        
-        assignment_pattern = re.match(
-            r'^[\s:=]+["\']?([^"\'\s;,#]+)["\']?',
-            remaining
-        )
-        
-        if assignment_pattern:
-            value = assignment_pattern.group(1)
-            return value[:max_length] if value else None
+        if assignment:
+            return assignment.group(1)[:max_length]
         
         return None
 
@@ -208,25 +964,7 @@ class PatternAnalyzer:
         Returns:
             Severity level: "HIGH", "MEDIUM", or "LOW"
         """
-        label_upper = (label or "").upper()
-        
-        high_indicators = [
-            "PRIVATE", "SECRET", "AWS", "TOKEN",
-            "SSH_PRIVATE_KEY", "PRIVATE_KEY", "CERTIFICATE"
-        ]
-        
-        if any(indicator in label_upper for indicator in high_indicators):
-            return "HIGH"
-        
-        medium_indicators = [
-            "PASSWORD", "PASS", "JWT", "API",
-            "GITHUB_TOKEN", "ACCESS_KEY", "OAUTH"
-        ]
-        
-        if any(indicator in label_upper for indicator in medium_indicators):
-            return "MEDIUM"
-        
-        return "LOW"
+        return _classify((label or "").upper())
 
     def search_keyword_in_file(
         self,
@@ -248,23 +986,12 @@ class PatternAnalyzer:
         matches = []
         
         try:
-            with open(file_path, 'rb') as file:
-                raw_content = file.read()
-            
-            try:
-                content = raw_content.decode('utf-8')
-            except UnicodeDecodeError:
-                content = raw_content.decode('latin-1', errors='ignore')
+            required = keyword.encode('ascii') if keyword.isascii() else None
+            content = _read_text(file_path, required, case_sensitive)
+            if content is None:
+                return matches
             
-            lines = content.splitlines()
-            
-            for line_number, line in enumerate(lines, start=1):
-                if case_sensitive:
-                    if keyword in line:
-                        matches.append((line_number, line.strip()))
-                else:
-                    if keyword.lower() in line.lower():
-                        matches.append((line_number, line.strip()))
+            matches = self._keyword_lines(content, keyword, case_sensitive)
                         
         except Exception as error:
             print(highlight(
@@ -274,6 +1001,89 @@ class PatternAnalyzer:
         
         return matches
 
+    def scan_file_with_keyword(
+        self,
+        file_path: str,
+        keyword: str,
+        case_sensitive: bool = False,
+        max_context_length: int = 500
+    ) -> Tuple[List[Tuple[int, str]], List[Tuple[str, str, str, Optional[int]]]]:
+        """
+        Search a keyword in and scan a file from a single read.
+
+        Gives the same results as search_keyword_in_file followed by
+        scan_file, but the file is read, decoded and split only once.
+
+        Args:
+            file_path: Path to the file
+            keyword: Keyword to search for
+            case_sensitive: Whether the keyword search is case-sensitive
+            max_context_length: Maximum length of context to extract
+
+        Returns:
+            Tuple of (keyword matches, pattern findings)
+        """
+        matches = []
+        findings = []
+        
+        try:
+            content, is_binary = _read_text_sniffed(file_path)
+            lines = content.splitlines()
+            
+            matches = self._keyword_lines(
+                content, keyword, case_sensitive, lines
+            )
+            if not is_binary:
+                self._scan_content(
+                    content, max_context_length, findings, lines
+                )
+        except Exception as error:
+            print(highlight(
+                f"[!] Error scanning file {file_path}: {error}",
+                Fore.RED
+            ))
+        
+        return matches, findings
+
+    def _keyword_lines(
+        self,
+        content: str,
+        keyword: str,
+        case_sensitive: bool,
+        lines: Optional[List[str]] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Find the lines of decoded text that contain a keyword.
+
+        Args:
+            content: Decoded file content
+            keyword: Keyword to search for
+            case_sensitive: Whether the search is case-sensitive
+            lines: Lines of the content, if already split
+
+        Returns:
+            List of tuples containing (line_number, line_content)
+        """
+        # Lowercasing never crosses or changes line breaks, so the
+        # lowered text splits into the lowered lines
+        needle = keyword if case_sensitive else keyword.lower()
+        haystack = content if case_sensitive else content.lower()
+        if needle not in haystack:
+            return []
+        
+        if lines is None:
+            lines = content.splitlines()
+        targets = lines if case_sensitive else haystack.splitlines()
+        
+        return [
+            (line_number, line.strip())
+            for line_number, (line, target) in enumerate(
+                zip(lines, targets),
+                start=1
+            )
+            if needle in target
+        ]
+
     def get_statistics(
         self,
         findings: List[Tuple[str, str, str, Optional[int]]]
@@ -289,18 +1099,19 @@ class PatternAnalyzer:
         """
         from collections import Counter
         
-        labels = [finding[0] for finding in findings]
-        severities = [
-            self.classify_severity(label)
-            for label in labels
-        ]
+        label_counts = Counter(finding[0] for finding in findings)
+        
+        # Severity depends only on the label, so classify each label once
+        severity_counts = Counter()
+        for label, count in label_counts.items():
+            severity_counts[self.classify_severity(label)] += count
         
         return {
             "total_findings": len(findings),
-            "unique_labels": len(set(labels)),
-            "label_counts": dict(Counter(labels)),
-            "severity_counts": dict(Counter(severities)),
-            "high_severity_count": severities.count("HIGH"),
-            "medium_severity_count": severities.count("MEDIUM"),
-            "low_severity_count": severities.count("LOW")
+            "unique_labels": len(label_counts),
+            "label_counts": dict(label_counts),
+            "severity_counts": dict(severity_counts),
+            "high_severity_count": severity_counts["HIGH"],
+            "medium_severity_count": severity_counts["MEDIUM"],
+            "low_severity_count": severity_counts["LOW"]
         }
@@ -5,16 +5,31 @@ This module generates comprehensive threat intelligence reports
 in Markdown format from scan results.
 """
 
+import heapq
 import os
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, TextIO
 
 from colorama import Fore
 
 from gitminer.utils import highlight, slugify
 
+# Characters that would break a Markdown table cell or inline code span
+_MD_ESCAPE = str.maketrans({'`': "'", '|': '\\|'})
+
+
+def _write_lines(out: TextIO, lines: List[str]) -> None:
+    """
+    Write lines of Markdown, each terminated by a newline.
+
+    Args:
+        out: Text stream to write to
+        lines: Lines to write
+    """
+    out.writelines(f"{line}\n" for line in lines)
+
 
 class ReportGenerator:
     """
@@ -60,21 +75,14 @@ class ReportGenerator:
         report_filename = f"report_{dork_slug}_{timestamp}.md"
         report_path = self.output_directory / report_filename
         
-        sections = []
-        sections.append(self._generate_header(dork))
-        sections.append(self._generate_index())
-        sections.append(
-            self._generate_executive_summary(dork, results, findings)
-        )
-        sections.append(self._generate_severity_tables(findings))
-        sections.append(self._generate_technical_analysis(findings))
-        sections.append(self._generate_metadata())
-        
-        report_content = "\n".join(sections)
-        
         try:
             with open(report_path, 'w', encoding='utf-8') as file:
-                file.write(report_content)
+                self._write_header(file, dork)
+                self._write_index(file)
+                self._write_executive_summary(file, dork, results, findings)
+                self._write_severity_tables(file, findings)
+                self._write_technical_analysis(file, findings)
+                self._write_metadata(file)
             
             print(highlight(
                 f"[+] Threat intelligence report generated: {report_path}",
@@ -90,19 +98,17 @@ class ReportGenerator:
             ))
             return ""
 
-    def _generate_header(self, dork: str) -> str:
+    def _write_header(self, out: TextIO, dork: str) -> None:
         """
-        Generate report header section.
+        Write report header section.
 
         Args:
+            out: Text stream the Markdown is written to
             dork: The search query
-
-        Returns:
-            Markdown formatted header
         """
         now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
         
-        lines = [
+        _write_lines(out, [
             f"# Threat Intelligence Report — Dork: `{dork}`",
             "",
             f"**Date:** {now_str}",
@@ -111,18 +117,16 @@ class ReportGenerator:
             "",
             "---",
             ""
-        ]
-        
-        return "\n".join(lines)
+        ])
 
-    def _generate_index(self) -> str:
+    def _write_index(self, out: TextIO) -> None:
         """
-        Generate table of contents.
+        Write table of contents.
 
-        Returns:
-            Markdown formatted index
+        Args:
+            out: Text stream the Markdown is written to
         """
-        lines = [
+        _write_lines(out, [
             "## 📖 Table of Contents",
             "",
             "- [Executive Summary](#executive-summary)",
@@ -136,31 +140,25 @@ class ReportGenerator:
             "",
             "---",
             ""
-        ]
-        
-        return "\n".join(lines)
+        ])
 
-    def _generate_executive_summary(
+    def _write_executive_summary(
         self,
+        out: TextIO,
         dork: str,
         results: List[Dict[str, Any]],
         findings: List[Tuple]
-    ) -> str:
+    ) -> None:
         """
-        Generate executive summary section.
+        Write executive summary section.
 
         Args:
+            out: Text stream the Markdown is written to
             dork: The search query
             results: Search results
             findings: List of findings
-
-        Returns:
-            Markdown formatted executive summary
         """
-        lines = [
-            "## 🧭 Executive Summary",
-            ""
-        ]
+        out.write("## 🧭 Executive Summary\n\n")
         
         repositories = set()
         for finding in findings:
@@ -170,41 +168,38 @@ class ReportGenerator:
         total_findings = len(findings)
         total_repos = len(repositories)
         
-        lines.append(
+        out.write(
             f"The search query `{dork}` identified **{total_findings} "
-            f"potential exposures** across **{total_repos} public repositories**."
+            f"potential exposures** across **{total_repos} public repositories**.\n"
         )
-        lines.append("")
+        out.write("\n")
         
         if findings:
             severity_counter = Counter([f[0] for f in findings])
             
             if severity_counter:
-                lines.append("### Severity Distribution")
-                lines.append("")
+                out.write("### Severity Distribution\n\n")
                 
                 for severity in ["HIGH", "MEDIUM", "LOW"]:
                     count = severity_counter.get(severity, 0)
                     if count > 0:
-                        lines.append(f"- **{severity}**: {count} findings")
+                        out.write(f"- **{severity}**: {count} findings\n")
                 
-                lines.append("")
+                out.write("\n")
         
         if findings:
             label_counter = Counter([f[1] for f in findings])
             
             if label_counter:
-                lines.append("### Top Finding Types")
-                lines.append("")
+                out.write("### Top Finding Types\n\n")
                 
                 for label, count in label_counter.most_common(10):
-                    lines.append(f"- **{label}**: {count} occurrences")
+                    out.write(f"- **{label}**: {count} occurrences\n")
                 
-                lines.append("")
+                out.write("\n")
         
         if repositories:
-            lines.append("### Affected Repositories")
-            lines.append("")
+            out.write("### Affected Repositories\n\n")
             
             repo_findings = {}
             for finding in findings:
@@ -212,101 +207,95 @@ class ReportGenerator:
                     repo = finding[5]
                     repo_findings[repo] = repo_findings.get(repo, 0) + 1
             
-            lines.append("| Repository | Findings |")
-            lines.append("|:-----------|----------:|")
+            out.write("| Repository | Findings |\n")
+            out.write("|:-----------|----------:|\n")
             
             for repo, count in sorted(
                 repo_findings.items(),
                 key=lambda x: -x[1]
             )[:20]:
-                lines.append(f"| `{repo}` | {count} |")
+                out.write(f"| `{repo}` | {count} |\n")
             
-            lines.append("")
-        
-        lines.append("---")
-        lines.append("")
+            out.write("\n")
         
-        return "\n".join(lines)
+        out.write("---\n\n")
 
-    def _generate_severity_tables(
+    def _write_severity_tables(
         self,
+        out: TextIO,
         findings: List[Tuple]
-    ) -> str:
+    ) -> None:
         """
-        Generate findings tables organized by severity.
+        Write findings tables organized by severity.
 
         Args:
+            out: Text stream the Markdown is written to
             findings: List of findings
-
-        Returns:
-            Markdown formatted severity tables
         """
-        lines = [
-            "## 🧨 Findings by Severity",
-            ""
-        ]
+        out.write("## 🧨 Findings by Severity\n\n")
+        
+        severities = ["HIGH", "MEDIUM", "LOW"]
+        label_counters = {severity: Counter() for severity in severities}
+        label_samples = {severity: {} for severity in severities}
         
-        for severity in ["HIGH", "MEDIUM", "LOW"]:
-            lines.append(f"### {severity} Severity")
-            lines.append("")
+        for finding in findings:
+            counter = label_counters.get(finding[0])
+            if counter is None:
+                continue
             
-            severity_findings = [f for f in findings if f[0] == severity]
+            label = finding[1]
+            counter[label] += 1
+            samples = label_samples[finding[0]].setdefault(label, [])
+            if len(samples) < 3:
+                samples.append(finding[2])
+        
+        for severity in severities:
+            out.write(f"### {severity} Severity\n\n")
             
-            if not severity_findings:
-                lines.append(f"No {severity} severity findings detected.")
-                lines.append("")
-                continue
+            label_counter = label_counters[severity]
             
-            label_counter = Counter([f[1] for f in severity_findings])
+            if not label_counter:
+                out.write(f"No {severity} severity findings detected.\n\n")
+                continue
             
-            lines.append("| Finding Type | Count | Sample Matches |")
-            lines.append("|:-------------|------:|:---------------|")
+            out.write("| Finding Type | Count | Sample Matches |\n")
+            out.write("|:-------------|------:|:---------------|\n")
             
             for label, count in label_counter.most_common(50):
-                samples = [
-                    f[2] for f in severity_findings if f[1] == label
-                ][:3]
+                samples = label_samples[severity][label]
                 
                 clean_samples = []
                 for sample in samples:
-                    clean = sample.replace('`', "'").replace('|', '\\|')
-                    if len(clean) > 40:
-                        clean = clean[:40] + "..."
-                    clean_samples.append(clean)
+                    clean = sample.translate(_MD_ESCAPE)
+                    clean_samples.append(
+                        f"{clean[:40]}..." if len(clean) > 40 else clean
+                    )
                 
                 samples_str = ", ".join(clean_samples)
                 
-                lines.append(f"| **{label}** | {count} | `{samples_str}` |")
+                out.write(f"| **{label}** | {count} | `{samples_str}` |\n")
             
-            lines.append("")
-        
-        lines.append("---")
-        lines.append("")
+            out.write("\n")
         
-        return "\n".join(lines)
+        out.write("---\n\n")
 
-    def _generate_technical_analysis(
+    def _write_technical_analysis(
         self,
+        out: TextIO,
         findings: List[Tuple]
-    ) -> str:
+    ) -> None:
         """
-        Generate detailed technical analysis section.
+        Write detailed technical analysis section.
 
         Args:
+            out: Text stream the Markdown is written to
             findings: List of findings
-
-        Returns:
-            Markdown formatted technical analysis
         """
-        lines = [
-            "## ⚙️ Technical Analysis",
-            ""
-        ]
+        out.write("## ⚙️ Technical Analysis\n\n")
         
         if not findings:
-            lines.append("> No findings to analyze.")
-            lines.append("")
-            return "\n".join(lines)
+            out.write("> No findings to analyze.\n\n")
+            return
         
         by_repo_file = {}
         
@@ -316,33 +305,28 @@ class ReportGenerator:
                 url = finding[8] if len(finding) > 8 else ""
                 
                 key = (repo, path, url, local)
-                if key not in by_repo_file:
-                    by_repo_file[key] = []
-                
-                by_repo_file[key].append(
+                by_repo_file.setdefault(key, []).append(
                     (severity, label, matched, context, line_no)
                 )
         
-        sorted_files = sorted(
+        top_files = heapq.nlargest(
+            50,
             by_repo_file.items(),
-            key=lambda x: len(x[1]),
-            reverse=True
+            key=lambda x: len(x[1])
         )
         
-        for (repo, path, url, local_path), file_findings in sorted_files[:50]:
-            lines.append(f"### Repository: `{repo}`")
-            lines.append("")
-            lines.append(f"**File:** `{path}`")
+        for (repo, path, url, local_path), file_findings in top_files:
+            out.write(f"### Repository: `{repo}`\n\n")
+            out.write(f"**File:** `{path}`\n")
             
             if url:
-                lines.append(f"**URL:** [{url}]({url})")
+                out.write(f"**URL:** [{url}]({url})\n")
             
             if local_path:
-                lines.append(f"**Local Path:** `{local_path}`")
+                out.write(f"**Local Path:** `{local_path}`\n")
             
-            lines.append("")
-            lines.append(f"**Total Findings:** {len(file_findings)}")
-            lines.append("")
+            out.write("\n")
+            out.write(f"**Total Findings:** {len(file_findings)}\n\n")
             
             for severity, label, matched, context, line_no in file_findings[:10]:
                 line_display = f"Line {line_no}" if line_no else "Unknown line"
@@ -351,47 +335,40 @@ class ReportGenerator:
                 if len(matched) > 100:
                     matched_display += "..."
                 
-                lines.append(
-                    f"- **{severity}** | `{label}` | {line_display}"
-                )
-                lines.append(f"  - Match: `{matched_display}`")
+                out.write(f"- **{severity}** | `{label}` | {line_display}\n")
+                out.write(f"  - Match: `{matched_display}`\n")
                 
                 if context:
                     context_display = context[:200]
                     if len(context) > 200:
                         context_display += "..."
-                    lines.append(f"  - Context: `{context_display}`")
+                    out.write(f"  - Context: `{context_display}`\n")
                 
-                lines.append("")
+                out.write("\n")
             
             if len(file_findings) > 10:
                 remaining = len(file_findings) - 10
-                lines.append(
-                    f"*... and {remaining} more findings in this file*"
+                out.write(
+                    f"*... and {remaining} more findings in this file*\n\n"
                 )
-                lines.append("")
             
-            lines.append("---")
-            lines.append("")
+            out.write("---\n\n")
         
-        if len(sorted_files) > 50:
-            remaining_files = len(sorted_files) - 50
-            lines.append(
+        if len(by_repo_file) > 50:
+            remaining_files = len(by_repo_file) - 50
+            out.write(
                 f"*Note: {remaining_files} additional files with findings "
-                "not shown in this report.*"
+                "not shown in this report.*\n\n"
             )
-            lines.append("")
-        
-        return "\n".join(lines)
 
-    def _generate_recommendations(self) -> str:
+    def _write_recommendations(self, out: TextIO) -> None:
         """
-        Generate security recommendations section.
+        Write security recommendations section.
 
-        Returns:
-            Markdown formatted recommendations
+        Args:
+            out: Text stream the Markdown is written to
         """
-        lines = [
+        _write_lines(out, [
             "## 🛡️ Recommendations",
             "",
             "### Immediate Actions",
@@ -425,21 +402,19 @@ class ReportGenerator:
             "",
             "---",
             ""
-        ]
-        
-        return "\n".join(lines)
+        ])
 
-    def _generate_metadata(self) -> str:
+    def _write_metadata(self, out: TextIO) -> None:
         """
-        Generate report metadata section.
+        Write report metadata section, which ends the report.
 
-        Returns:
-            Markdown formatted metadata
+        Args:
+            out: Text stream the Markdown is written to
         """
         now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
         user = os.getenv('USER', 'N/A')
         
-        lines = [
+        _write_lines(out, [
             "## 🧾 Metadata",
             "",
             f"- **Generated:** {now_str}",
@@ -450,8 +425,5 @@ class ReportGenerator:
             "---",
             "",
             "*Report generated by GitMiner v3 - "
-            "GitHub Secret Scanner and Threat Intelligence Tool*",
-            ""
-        ]
-        
-        return "\n".join(lines)
+            "GitHub Secret Scanner and Threat Intelligence Tool*"
+        ])
@@ -5,17 +5,61 @@ This module provides common utility functions used throughout the application,
 including text formatting, file sanitization, and query parsing.
 """
 
+import functools
 import re
+import string
+import sys
 import unicodedata
 from typing import Optional
 
 from colorama import Fore, Style
 
+_IS_TTY = bool(sys.stdout is not None and sys.stdout.isatty())
+
+_GLOBAL_FLAGS_RE = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+_INLINE_FLAGS = {
+    'a': re.ASCII,
+    'i': re.IGNORECASE,
+    'L': re.LOCALE,
+    'm': re.MULTILINE,
+    's': re.DOTALL,
+    'u': re.UNICODE,
+    'x': re.VERBOSE,
+}
+
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Query parsing expressions used by extract_keyword_from_query
+_FILENAME_QUALIFIER_RE = re.compile(r'filename\s*:\s*([^\s]+)', re.IGNORECASE)
+_EXTENSION_QUALIFIER_RE = re.compile(r'extension\s*:\s*([^\s]+)', re.IGNORECASE)
+_QUOTED_TERM_RE = re.compile(r'"([^"]{2,100})"')
+_WHITESPACE_RE = re.compile(r'\s+')
+_QUERY_OPERATOR_RE = re.compile(r'^(OR|and|AND|\||\(|\)|-)$', re.IGNORECASE)
+
+_SLUG_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+
+class _SlugTable(dict):
+    """Translation table mapping every character outside _SLUG_CHARS to '_'."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = char if char in _SLUG_CHARS else '_'
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+
 
 def highlight(text: str, color: str = Fore.CYAN, bold: bool = False) -> str:
     """
     Apply color and style formatting to text for terminal output.
 
+    When stdout is not a terminal (piped or redirected output) the text
+    is returned unchanged.
+
     Args:
         text: The text to format
         color: Colorama color constant (default: Fore.CYAN)
@@ -24,11 +68,14 @@ def highlight(text: str, color: str = Fore.CYAN, bold: bool = False) -> str:
     Returns:
         Formatted text string with ANSI color codes
     """
+    if not _IS_TTY:
+        return text
     if bold:
         return Style.BRIGHT + color + text + Style.RESET_ALL
     return color + text + Style.RESET_ALL
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing or replacing invalid characters.
@@ -42,15 +89,18 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for use across platforms
     """
-    filename = unicodedata.normalize('NFKD', filename)
+    # ASCII text is already in NFKD form
+    if not filename.isascii():
+        filename = unicodedata.normalize('NFKD', filename)
 
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_SANITIZE_TABLE)
 
     filename = filename.replace('..', '_')
 
     return filename
 
 
+@functools.lru_cache(maxsize=None)
 def extract_keyword_from_query(query: str) -> str:
     """
     Extract the primary keyword from a GitHub dork query.
@@ -65,41 +115,52 @@ def extract_keyword_from_query(query: str) -> str:
     Returns:
         Extracted keyword or the original query if no pattern matches
     """
-    match = re.search(
-        r'filename\s*:\s*([^\s]+)',
-        query,
-        flags=re.IGNORECASE
-    )
+    match = _FILENAME_QUALIFIER_RE.search(query)
     if match:
         return match.group(1).strip().strip('"\'')
 
-    match = re.search(
-        r'extension\s*:\s*([^\s]+)',
-        query,
-        flags=re.IGNORECASE
-    )
+    match = _EXTENSION_QUALIFIER_RE.search(query)
     if match:
         return match.group(1).strip().strip('"\'')
 
-    match = re.search(r'"([^"]{2,100})"', query)
+    match = _QUOTED_TERM_RE.search(query)
     if match:
         return match.group(1)
 
-    tokens = re.split(r'\s+', query)
+    tokens = _WHITESPACE_RE.split(query)
 
     tokens = [
         token for token in tokens
-        if not re.match(
-            r'^(OR|and|AND|\||\(|\)|-)$',
-            token,
-            flags=re.IGNORECASE
-        )
+        if not _QUERY_OPERATOR_RE.match(token)
     ]
     tokens = [token for token in tokens if len(token) >= 3]
 
     return tokens[0] if tokens else query
 
 
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regex, moving leading inline flags to compile-time flags.
+
+    ``(?i)abc`` is compiled as ``re.compile('abc', re.IGNORECASE)`` so
+    the flags are part of the compiled object rather than the source.
+
+    Args:
+        pattern: Regex source string
+        flags: Additional flags to apply
+
+    Returns:
+        Compiled regex
+    """
+    match = _GLOBAL_FLAGS_RE.match(pattern)
+    if match:
+        for letter in match.group(1):
+            flags |= _INLINE_FLAGS[letter]
+        pattern = pattern[match.end():]
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str, max_length: int = 50) -> str:
     """
     Convert text to a slug suitable for filenames.
@@ -111,8 +172,7 @@ def slugify(text: str, max_length: int = 50) -> str:
     Returns:
         Slugified text with only alphanumeric characters, hyphens, and underscores
     """
-    slug = re.sub(r'[^a-zA-Z0-9_\-]', '_', text)
-    return slug[:max_length]
+    return text[:max_length].translate(_SLUG_TABLE)
 
 
 def truncate_text(text: str, max_length: int = 100) -> str:
@@ -26,11 +26,14 @@ Requirements:
 
 import argparse
 import csv
+import itertools
+import os
 import sys
-import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 
 from colorama import Fore, Back, init as colorama_init
 from tqdm import tqdm
@@ -47,6 +50,26 @@ from gitminer.utils import highlight, extract_keyword_from_query
 
 colorama_init(autoreset=True)
 
+# Number of file downloads opened concurrently ahead of the one being saved
+DOWNLOAD_WORKERS = 8
+
+# Number of file writes queued behind the one being recorded
+WRITE_BEHIND = 8
+
+# Write buffer for the CSV export, so rows reach the file in large writes
+CSV_BUFFER_SIZE = 1 << 20
+
+# Files larger than this, or with one of these extensions, are not
+# downloaded: a text secret scan has nothing to find in them
+MAX_DOWNLOAD_SIZE = 1 << 20
+SKIPPED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.zip', '.tar', '.gz', '.pdf',
+    '.woff', '.ttf', '.mp4', '.mp3', '.jar', '.class', '.so', '.dll'
+})
+
+# Leading bytes of a download checked for NUL, as git does for binaries
+BINARY_SNIFF_SIZE = 8192
+
 BANNER = r"""
    ██ ▄██ ██ ▄▄▄███ ██   ██ ██ ██   ██ ██ ▄██ ██ ▄██
    █▌     █▌   █▌   █▌▌▐▌█▌ █▌ █▌▌  █▌ █▌     █▌   █
@@ -59,6 +82,22 @@ BANNER = r"""
 """
 
 
+class Result(NamedTuple):
+    """
+    Processed search result: where a file came from and where it was saved.
+
+    The first six fields are the CSV export columns, in order.
+    """
+
+    dork: str
+    repository: str
+    path: str
+    local_path: Optional[str]
+    url: Optional[str]
+    snippet: str
+    keyword: str
+
+
 class GitMinerApplication:
     """
     Main application class for GitMiner v3.
@@ -79,7 +118,8 @@ class GitMinerApplication:
         self.config = ConfigManager(
             config_dir=args.config_dir,
             labels_file=args.labels_yaml,
-            patterns_file=args.patterns_yaml
+            patterns_file=args.patterns_yaml,
+            verbose=args.verbose
         )
 
         self.github_token = self.config.get_github_token()
@@ -105,6 +145,19 @@ class GitMinerApplication:
         ) / self.config.get_path('files', 'database')
         self.database = DatabaseManager(str(db_path))
 
+        for content_hash, local_path in self.database.get_content_hashes():
+            self.file_manager.register_content_hash(content_hash, local_path)
+
+        # Local paths of blobs already saved, keyed by git sha, and the
+        # saves still in progress on the writer thread
+        self._sha_cache: Dict[str, str] = {}
+        self._pending_saves: Dict[str, Future] = {}
+
+        # Pattern findings per local path, shared by analysis and reports
+        self._findings_cache: Dict[
+            str, List[Tuple[str, str, str, Optional[int]]]
+        ] = {}
+
         self.report_generator = ReportGenerator(
             output_directory=self.config.get_path('directories', 'reports')
         )
@@ -118,13 +171,32 @@ class GitMinerApplication:
         Returns:
             Configured GitHubClient instance
         """
+        data_directory = Path(self.config.get_path('directories', 'data'))
+        etag_cache = self.config.get_path('files', 'etag_cache')
+        etag_cache_path = data_directory / etag_cache if etag_cache else None
+        search_cache = self.config.get_path('files', 'search_cache')
+        search_cache_path = (
+            data_directory / search_cache if search_cache else None
+        )
+
         return GitHubClient(
-            token=self.github_token,
+            token=self.config.get_github_tokens() or self.github_token,
             search_url=self.config.get_github_config('search_url'),
             contents_url=self.config.get_github_config('contents_url'),
             rate_limit_url=self.config.get_github_config('rate_limit_url'),
             user_agent=self.config.get_github_config('user_agent'),
-            timeout=self.config.get_github_config('timeout')
+            timeout=self.config.get_github_config('timeout'),
+            etag_cache_path=str(etag_cache_path) if etag_cache_path else None,
+            search_cache_path=(
+                str(search_cache_path) if search_cache_path else None
+            ),
+            search_cache_ttl=(
+                self.config.get_github_config('search_cache_ttl') or 900
+            ),
+            graphql_url=(
+                self.config.get_github_config('graphql_url')
+                or 'https://api.github.com/graphql'
+            )
         )
 
     def _load_dorks(self) -> List[str]:
@@ -178,48 +250,65 @@ class GitMinerApplication:
             Fore.CYAN, bold=True
         ))
 
-        all_results = []
+        try:
+            all_results = []
 
-        for dork in self.dorks:
-            print(highlight(
-                f"\n[*] Processing dork:\n └➤ {Fore.YELLOW}{dork}{Fore.MAGENTA}\n",
-                Fore.MAGENTA,
-                bold=True
-            ))
+            for dork in self.dorks:
+                print(highlight(
+                    f"\n[*] Processing dork:\n └➤ {Fore.YELLOW}{dork}{Fore.MAGENTA}\n",
+                    Fore.MAGENTA,
+                    bold=True
+                ))
 
-            search_results = self.github_client.search_code(
-                query=dork,
-                per_page=self.args.per_page,
-                max_results=self.args.max_results,
-                sleep_between_pages=1.0
-            )
+                # File contents for each search page are fetched while the
+                # following pages are still being searched
+                with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                    prefetches = []
+                    search_results = self.github_client.search_code(
+                        query=dork,
+                        per_page=self.args.per_page,
+                        max_results=self.args.max_results,
+                        sleep_between_pages=1.0,
+                        use_cache=not self.args.no_cache,
+                        on_page=lambda page: prefetches.append(
+                            prefetcher.submit(self._prefetch_contents, page)
+                        )
+                    )
+                    for prefetch in prefetches:
+                        prefetch.result()
 
-            searched_at = datetime.now(timezone.utc).isoformat()
-            self.database.record_search(
-                dork=dork,
-                searched_at=searched_at,
-                results_count=len(search_results),
-                downloaded_count=0
-            )
+                searched_at = datetime.now(timezone.utc).isoformat()
+                self.database.record_search(
+                    dork=dork,
+                    searched_at=searched_at,
+                    results_count=len(search_results),
+                    downloaded_count=0
+                )
 
-            dork_results = self._process_search_results(
-                dork=dork,
-                results=search_results,
-                searched_at=searched_at
-            )
+                dork_results = self._process_search_results(
+                    dork=dork,
+                    results=search_results,
+                    searched_at=searched_at
+                )
+
+                all_results.extend(dork_results)
 
-            all_results.extend(dork_results)
+            self._display_summary(all_results)
 
-        self._display_summary(all_results)
+            if self.args.output_csv:
+                self._export_csv(all_results)
 
-        if self.args.output_csv:
-            self._export_csv(all_results)
+            grouped = defaultdict(list)
+            for result in all_results:
+                grouped[result.dork].append(result)
 
-        if not self.args.no_analyze and all_results:
-            self._analyze_files(all_results)
+            if not self.args.no_analyze and all_results:
+                self._analyze_files(grouped)
 
-        if self.args.report:
-            self._generate_reports(all_results)
+            if self.args.report:
+                self._generate_reports(grouped)
+        finally:
+            self.github_client.close()
 
         print(highlight(
             "\n[+] GitMiner execution completed successfully!",
@@ -232,7 +321,7 @@ class GitMinerApplication:
         dork: str,
         results: List[Dict[str, Any]],
         searched_at: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Result]:
         """
         Process search results: download files and record in database.
 
@@ -252,60 +341,272 @@ class GitMinerApplication:
             Fore.CYAN
         ))
 
-        with tqdm(
-            total=len(results),
-            desc="Downloading files",
-            unit="file"
-        ) as progress_bar:
+        # One transaction for the whole dork instead of a commit per file
+        self.database.begin()
 
-            for result in results:
-                repository = result['repository']
-                file_path = result['path']
+        def finish(result: Dict[str, Any], saved: Any) -> None:
+            repository = result['repository']
+            file_path = result['path']
+            local_path = saved.result() if isinstance(saved, Future) else saved
 
-                content = self.github_client.download_file_content(
+            # Only a save queued for this result is pending; skipped or
+            # failed downloads have nothing to clear
+            if (
+                isinstance(saved, Future)
+                and self._pending_saves.get(result['sha']) is saved
+            ):
+                del self._pending_saves[result['sha']]
+
+            if local_path:
+                self.database.record_downloaded_file(
+                    dork=dork,
                     repository=repository,
-                    path=file_path
+                    file_path=file_path,
+                    local_path=local_path,
+                    item_url=result.get('html_url'),
+                    searched_at=searched_at,
+                    file_size=os.path.getsize(local_path),
+                    content_hash=self.file_manager.get_content_hash(
+                        local_path
+                    ),
+                    sha=result.get('sha')
                 )
 
-                local_path = None
+                if result.get('sha'):
+                    self._sha_cache[result['sha']] = local_path
+
+            processed_results.append(Result(
+                dork,
+                repository,
+                file_path,
+                local_path,
+                result.get('html_url'),
+                result.get('snippet', ''),
+                keyword
+            ))
+            progress_bar.update(1)
 
-                if content:
-                    local_path = self.file_manager.save_file(
-                        content=content,
-                        repository=repository,
-                        file_path=file_path,
-                        dork_keyword=keyword
-                    )
+        # Files are written on a single writer thread, in result order so
+        # file names and content dedup come out as with inline writes,
+        # while the main thread moves on to the next download
+        writes = deque()
 
-                    if local_path:
-                        self.database.record_downloaded_file(
-                            dork=dork,
-                            repository=repository,
-                            file_path=file_path,
-                            local_path=local_path,
-                            item_url=result.get('html_url'),
-                            searched_at=searched_at,
-                            file_size=len(content)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as writer, tqdm(
+                total=len(results),
+                desc="Downloading files",
+                unit="file"
+            ) as progress_bar:
+
+                for result, local_path, stream in self._iter_downloads(results):
+                    saved = local_path
+
+                    if stream:
+                        chunks, size = stream
+                        saved = writer.submit(
+                            self.file_manager.save_stream,
+                            chunks=chunks,
+                            repository=result['repository'],
+                            file_path=result['path'],
+                            dork_keyword=keyword,
+                            size=size
                         )
+                        if result.get('sha'):
+                            self._pending_saves[result['sha']] = saved
 
-                result_record = {
-                    'dork': dork,
-                    'repository': repository,
-                    'path': file_path,
-                    'local_path': local_path,
-                    'url': result.get('html_url'),
-                    'snippet': result.get('snippet', ''),
-                    'keyword': keyword
-                }
-
-                processed_results.append(result_record)
-                progress_bar.update(1)
+                    writes.append((result, saved))
+                    while len(writes) > WRITE_BEHIND:
+                        finish(*writes.popleft())
 
-                time.sleep(0.05)
+                while writes:
+                    finish(*writes.popleft())
+        finally:
+            self.database.commit()
 
         return processed_results
 
-    def _display_summary(self, results: List[Dict[str, Any]]) -> None:
+    def _prefetch_contents(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Fetch the contents of a page of search results in batch.
+
+        Blobs saved earlier in this run or by a previous one need
+        neither a batch fetch nor a download, so they are left out.
+        Errors are reported and leave the results to be downloaded
+        one by one.
+
+        Args:
+            results: Search results of one page
+        """
+        try:
+            self.github_client.fetch_contents([
+                result for result in results
+                if not result.get('sha')
+                or not self._find_saved_blob(result['sha'])
+            ])
+        except Exception as error:
+            print(highlight(
+                f"[!] Error fetching file contents: {error}",
+                Fore.RED
+            ))
+
+    def _iter_downloads(
+        self,
+        results: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[
+        Dict[str, Any], Optional[str], Optional[Tuple[Any, Optional[int]]]
+    ]]:
+        """
+        Open file downloads concurrently and yield them in result order.
+
+        Binary or oversized files are skipped. Results whose blob sha
+        was already saved, in this run or a previous one, reuse the
+        existing file without a download.
+        Results whose content was already fetched in batch are yielded
+        directly. For the others, up to DOWNLOAD_WORKERS downloads are
+        started ahead on a thread pool so their round trips overlap
+        while the current file is written to disk.
+
+        Args:
+            results: List of search results
+
+        Yields:
+            Tuples of (result, local_path, stream), where local_path is
+            the existing file for an already saved blob and stream is a
+            (chunks, size) tuple to save, or None if the file was skipped
+            or the download failed
+        """
+        items = iter(results)
+        pending = deque()
+        queued = set()
+
+        def download(result: Dict[str, Any]) -> Future:
+            return executor.submit(self._open_download, result)
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            def fill() -> None:
+                while len(pending) < DOWNLOAD_WORKERS:
+                    result = next(items, None)
+                    if result is None:
+                        return
+
+                    sha = result.get('sha')
+                    content = result.pop('content', None)
+                    if self._is_skipped(result):
+                        pending.append((result, None))
+                        continue
+                    if sha and (sha in queued or self._find_saved_blob(sha)):
+                        # Resolved once the earlier copy has been saved
+                        pending.append((result, sha))
+                    elif content is not None:
+                        pending.append((result, ((content,), len(content))))
+                    else:
+                        pending.append((result, download(result)))
+
+                    if sha:
+                        queued.add(sha)
+
+            fill()
+            while pending:
+                result, stream = pending.popleft()
+                fill()
+
+                if isinstance(stream, str):
+                    local_path = self._find_saved_blob(stream)
+                    if local_path:
+                        yield result, local_path, None
+                        continue
+                    stream = download(result)
+
+                if isinstance(stream, Future):
+                    stream = stream.result()
+
+                yield result, None, stream
+
+    def _is_skipped(self, result: Dict[str, Any]) -> bool:
+        """
+        Check whether a search result is not worth downloading.
+
+        Args:
+            result: Search result, with size and binary flags when the
+                batch content fetch found its blob
+
+        Returns:
+            True for known binary extensions, blobs reported as binary
+            and blobs larger than MAX_DOWNLOAD_SIZE
+        """
+        extension = os.path.splitext(result['path'])[1].lower()
+        return (
+            extension in SKIPPED_EXTENSIONS
+            or result.get('binary', False)
+            or (result.get('size') or 0) > MAX_DOWNLOAD_SIZE
+        )
+
+    def _open_download(
+        self,
+        result: Dict[str, Any]
+    ) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """
+        Open a file download, dropping oversized or binary bodies.
+
+        Runs on the download pool. Bodies declared larger than
+        MAX_DOWNLOAD_SIZE are not read; otherwise the first chunk is read
+        and a NUL byte among its leading BINARY_SNIFF_SIZE bytes marks
+        the body as binary.
+
+        Args:
+            result: Search result to download
+
+        Returns:
+            (chunks, size) tuple to save, or None if the download failed
+            or was dropped
+        """
+        stream = self.github_client.download_file_stream(
+            repository=result['repository'],
+            path=result['path'],
+            sha=result.get('sha'),
+            max_size=MAX_DOWNLOAD_SIZE
+        )
+        if stream is None:
+            return None
+
+        chunks, size = stream
+        chunks = iter(chunks)
+        first = next(chunks, b'')
+        if b'\x00' not in first[:BINARY_SNIFF_SIZE]:
+            return itertools.chain((first,), chunks), size
+
+        # Closing the started stream releases its connection
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+        return None
+
+    def _find_saved_blob(self, sha: str) -> Optional[str]:
+        """
+        Find the local file a blob was already saved to.
+
+        Args:
+            sha: Git blob SHA from the search result
+
+        Returns:
+            Existing local path, or None if the blob must be downloaded
+        """
+        pending = self._pending_saves.get(sha)
+        if pending is not None:
+            local_path = pending.result()
+        else:
+            local_path = self._sha_cache.get(sha)
+        if local_path is None:
+            local_path = self.database.get_local_path_by_sha(sha)
+
+        if local_path and os.path.exists(local_path):
+            self._sha_cache[sha] = local_path
+            return local_path
+
+        self._sha_cache.pop(sha, None)
+        return None
+
+    def _display_summary(self, results: List[Result]) -> None:
         """
         Display execution summary.
 
@@ -314,7 +615,7 @@ class GitMinerApplication:
         """
         total_files = len(results)
         downloaded_files = sum(
-            1 for r in results if r.get('local_path')
+            1 for r in results if r.local_path
         )
 
         print(highlight(
@@ -324,7 +625,7 @@ class GitMinerApplication:
             bold=True
         ))
 
-    def _export_csv(self, results: List[Dict[str, Any]]) -> None:
+    def _export_csv(self, results: List[Result]) -> None:
         """
         Export results to CSV file.
 
@@ -334,25 +635,16 @@ class GitMinerApplication:
         csv_path = self.args.output_csv
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(
-                    file,
-                    fieldnames=[
-                        'dork', 'repository', 'path',
-                        'local_path', 'url', 'snippet'
-                    ]
-                )
-                writer.writeheader()
-
-                for result in results:
-                    writer.writerow({
-                        'dork': result.get('dork', ''),
-                        'repository': result.get('repository', ''),
-                        'path': result.get('path', ''),
-                        'local_path': result.get('local_path', ''),
-                        'url': result.get('url', ''),
-                        'snippet': result.get('snippet', '')
-                    })
+            with open(
+                csv_path, 'w', newline='', encoding='utf-8',
+                buffering=CSV_BUFFER_SIZE
+            ) as file:
+                writer = csv.writer(file)
+                writer.writerow([
+                    'dork', 'repository', 'path',
+                    'local_path', 'url', 'snippet'
+                ])
+                writer.writerows(result[:6] for result in results)
 
             print(highlight(
                 f"[+] Results exported to CSV: {csv_path}",
@@ -365,21 +657,25 @@ class GitMinerApplication:
                 Fore.RED
             ))
 
-    def _analyze_files(self, results: List[Dict[str, Any]]) -> None:
+    def _analyze_files(
+        self,
+        grouped: Dict[str, List[Result]]
+    ) -> None:
         """
         Analyze downloaded files for sensitive patterns.
 
         Args:
-            results: List of processed results
+            grouped: Processed results grouped by dork
         """
-        
-
-        grouped = {}
-        for result in results:
-            dork = result.get('dork', '')
-            if dork not in grouped:
-                grouped[dork] = []
-            grouped[dork].append(result)
+        # Every file of every dork goes through one worker pool; results
+        # come back in submission order, so output matches a serial scan
+        tasks = [
+            (result.local_path, extract_keyword_from_query(dork))
+            for dork, dork_results in grouped.items()
+            for result in dork_results
+            if result.local_path
+        ]
+        analyses = self.pattern_analyzer.analyze_files(tasks)
 
         for dork, dork_results in grouped.items():
             keyword = extract_keyword_from_query(dork)
@@ -392,38 +688,33 @@ class GitMinerApplication:
             total_matches = 0
 
             for result in dork_results:
-                local_path = result.get('local_path')
+                local_path = result.local_path
 
                 if not local_path:
                     continue
 
-                keyword_matches = self.pattern_analyzer.search_keyword_in_file(
-                    file_path=local_path,
-                    keyword=keyword,
-                    case_sensitive=False
-                )
-
-                pattern_findings = self.pattern_analyzer.scan_file(
-                    file_path=local_path
-                )
+                keyword_matches, pattern_findings = next(analyses)
+                self._findings_cache[local_path] = pattern_findings
 
                 if keyword_matches or pattern_findings:
-                    print(highlight(
+                    # Everything reported for a file goes out in one write
+                    output = [highlight(
                         f"\n[FILE] {local_path}\n",
                         Fore.CYAN,
                         bold=True
-                    ))
+                    )]
 
                     if keyword_matches:
                         for line_no, line_content in keyword_matches[:10]:
-                            print(
-                                f"{Fore.YELLOW}  >{line_no:5d} | "
-                                f"{Fore.BLACK}{Back.WHITE}{line_content}"
-                            )
+                            output.append(highlight(
+                                f"  >{line_no:5d} | "
+                                f"{Fore.BLACK}{Back.WHITE}{line_content}",
+                                Fore.YELLOW
+                            ))
                         total_matches += len(keyword_matches)
 
                     if pattern_findings:
-                        print(highlight(
+                        output.append(highlight(
                             "\n   [INF] Pattern Detection Results:\n",
                             Fore.MAGENTA
                         ))
@@ -434,25 +725,36 @@ class GitMinerApplication:
                             )
                             line_display = f">{line_no:5d}" if line_no else ">  ???"
 
-                            print(
-                                f"{Fore.RED}   [{severity}] [{label}] "
-                                f"{line_display} | {Fore.WHITE}{matched[:80]}"
-                            )
+                            output.append(highlight(
+                                f"   [{severity}] [{label}] "
+                                f"{line_display} | {Fore.WHITE}{matched[:80]}",
+                                Fore.RED
+                            ))
 
                         total_matches += len(pattern_findings)
 
+                    output.append('')
+                    sys.stdout.write('\n'.join(output))
+
             if total_matches == 0:
                 print(highlight(
                     f"[i] No matches found for '{keyword}' in downloaded files.",
                     Fore.YELLOW
                 ))
 
-    def _generate_reports(self, results: List[Dict[str, Any]]) -> None:
+            sys.stdout.flush()
+
+        analyses.close()
+
+    def _generate_reports(
+        self,
+        grouped: Dict[str, List[Result]]
+    ) -> None:
         """
         Generate threat intelligence reports.
 
         Args:
-            results: List of processed results
+            grouped: Processed results grouped by dork
         """
         print(highlight(
             "\n[*] Generating threat intelligence reports...",
@@ -460,23 +762,19 @@ class GitMinerApplication:
             bold=True
         ))
 
-        grouped = {}
-        for result in results:
-            dork = result.get('dork', '')
-            if dork not in grouped:
-                grouped[dork] = []
-            grouped[dork].append(result)
-
         for dork, dork_results in grouped.items():
             all_findings = []
 
             for result in dork_results:
-                local_path = result.get('local_path')
+                local_path = result.local_path
 
                 if not local_path:
                     continue
 
-                findings = self.pattern_analyzer.scan_file(local_path)
+                findings = self._findings_cache.get(local_path)
+                if findings is None:
+                    findings = self.pattern_analyzer.scan_file(local_path)
+                    self._findings_cache[local_path] = findings
 
                 for label, matched, context, line_no in findings:
                     severity = self.pattern_analyzer.classify_severity(label)
@@ -487,10 +785,10 @@ class GitMinerApplication:
                         matched,
                         context,
                         line_no,
-                        result.get('repository', ''),
-                        result.get('path', ''),
+                        result.repository,
+                        result.path,
                         local_path,
-                        result.get('url', '')
+                        result.url
                     )
 
                     all_findings.append(finding_tuple)
@@ -556,9 +854,9 @@ Environment Variables:
     parser.add_argument(
         '-p', '--per-page',
         type=int,
-        default=30,
+        default=100,
         dest='per_page',
-        help='Results per page for GitHub API (default: 30, max: 100)'
+        help='Results per page for GitHub API (default: 100, max: 100)'
     )
 
     parser.add_argument(
@@ -599,6 +897,19 @@ Environment Variables:
         help='Custom patterns YAML file (overrides default)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        dest='no_cache',
+        help='Bypass the cache of recent search results'
+    )
+
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Show informational messages while loading configuration'
+    )
+
     return parser.parse_args()
 
 